@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 import io
 import os
+import sys
 from functools import lru_cache
 from datetime import timezone, timedelta
 
@@ -1214,6 +1215,12 @@ def render_comparison_tab():
                     del st.session_state.comparison_dataset_name
 
 
+@lru_cache(maxsize=128)
+def _mt_col(name: str) -> str:
+    """Build the interned 'MT (<date>)' column label for a comparison file"""
+    return sys.intern(f"MT ({name})")
+
+
 def get_comparison_data_for_dashboard():
     """
     Get comparison data formatted for the main dashboard display.
@@ -1265,8 +1272,8 @@ def get_comparison_data_for_dashboard():
             file1_display = file1_date_str if file1_date_str != "Unknown" else "File 1"
             file2_display = file2_date_str if file2_date_str != "Unknown" else "File 2"
             comparison_data = comparison_data.rename(columns={
-                'old_stock': f'MT ({file1_display})',
-                'new_stock': f'MT ({file2_display})',
+                'old_stock': _mt_col(file1_display),
+                'new_stock': _mt_col(file2_display),
                 'delta': 'Change in Stock',  # This creates the Change in Stock column from delta
                 'status': 'Status'
             })
@@ -1280,7 +1287,7 @@ def get_comparison_data_for_dashboard():
             # Define preferred ordering for key columns (keep others for filtering)
             desired_columns = [
                 'Specification', 'Grade', 'OD', 'WT', 'OD_Category', 'WT_Schedule',
-                f'MT ({file1_display})', f'MT ({file2_display})', 'Change in Stock', 'Status',
+                _mt_col(file1_display), _mt_col(file2_display), 'Change in Stock', 'Status',
                 'Add_Spec', 'Make', 'Branch'
             ]
             ordered_columns = [col for col in desired_columns if col in comparison_data.columns]
@@ -123,10 +123,11 @@ SCHEDULE_TIMEZONE = "Asia/Kolkata"
 # Email Sending Configuration
 # ============================================================================
 
-# Delay in seconds between sending emails to different recipients
-# This helps avoid SMTP rate limits when sending to ~20 recipients
-# Recommended: 1-2 seconds
-EMAIL_DELAY_SECONDS = 1.5
+# Outgoing email rate limit (token bucket): at most RATE_LIMIT_MSGS messages per
+# RATE_LIMIT_WINDOW_SEC seconds. Small batches go out without waiting; larger ones
+# are paced to the same average rate as a fixed 1.5s delay between sends.
+RATE_LIMIT_MSGS = 20
+RATE_LIMIT_WINDOW_SEC = 30
 
 # ============================================================================
 # File Paths and Directories
@@ -143,6 +144,14 @@ LOGS_DIR = "logs"
 # Log file name
 LOG_FILENAME = "report_generator.log"
 
+# Directory for cached preprocessed inventory sheets (Parquet)
+# Relative to project root
+PREPROCESSED_CACHE_DIR = "cache"
+
+# Log level for the reporting loggers, read from environment variable LOG_LEVEL
+# (e.g. LOG_LEVEL=INFO to keep debug records out of the log file). Defaults to DEBUG.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").strip().upper() or "DEBUG"
+
 # ============================================================================
 # SMTP Configuration
 # ============================================================================
@@ -156,6 +165,18 @@ LOG_FILENAME = "report_generator.log"
 # Default SMTP port (used if SMTP_PORT environment variable is not set)
 DEFAULT_SMTP_PORT = 587
 
+# Maximum number of messages sent over one SMTP connection before it is
+# closed and re-opened (avoids server-side idle/session limits on long batches)
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# Number of concurrent SMTP connections used for per-recipient sends
+# Kept small to stay within provider per-host connection limits
+SMTP_POOL_SIZE = 5
+
+# Per-recipient sends to at least this many recipients are aborted once a third
+# of them have failed - the server is most likely refusing the whole batch
+EARLY_ABORT_MIN_RECIPIENTS = 30
+
 # ============================================================================
 # Date Format Configuration
 # ============================================================================
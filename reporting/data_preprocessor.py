@@ -6,29 +6,91 @@ used by the dashboard before heatmap generation.
 
 IMPORTANT: This module copies preprocessing logic from the dashboard
 to ensure identical data handling. No modifications to original logic.
+
+The step helpers below work on the DataFrame they are given rather than a
+defensive copy - preprocess_inventory_sheet() owns the frame freshly read
+from Excel by preprocess_inventory_data(), so copying it at every step only wastes memory.
 """
 
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
 # Import grade derivation function from heatmap_generator
 try:
-    from reporting.heatmap_generator import derive_grade_from_spec
+    from reporting.heatmap_generator import derive_grades_from_specs, SPECIFICATION_MAPPING_FILE
 except ImportError:
     # Fallback if import fails
-    derive_grade_from_spec = None
+    derive_grades_from_specs = None
+    SPECIFICATION_MAPPING_FILE = None
+
+from reporting.config import PREPROCESSED_CACHE_DIR
 
 from reporting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the Rust-based calamine reader when installed - it parses the XLSX
+# XML natively and is several times faster than the default openpyxl engine.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+    logger.debug("python-calamine not installed. Falling back to default Excel engine.")
+
+# openpyxl fallback for .xlsx: stream rows in read-only mode instead of building
+# the full cell grid, and read cached values rather than formulas
+OPENPYXL_ENGINE_KWARGS = {"read_only": True, "data_only": True}
+
+# String dtype used to normalize Specification values - Arrow-backed when pyarrow
+# is installed so strip/replace run as native kernels instead of per-object Python
+try:
+    import pyarrow  # noqa: F401
+    SPECIFICATION_DTYPE = "string[pyarrow]"
+except ImportError:
+    SPECIFICATION_DTYPE = "string"
+
+# Column-name standardization table: spaces/dashes -> underscores, periods removed.
+# str.translate applies all three in a single pass over each name.
+_COL_TRANS = str.maketrans({" ": "_", "-": "_", ".": ""})
+
+# Exact "MT" header or pandas-generated duplicates "MT.1", "MT.2", ... (case-sensitive)
+_MT_COLUMN_RE = re.compile(r"MT(\.\d+)?")
+
+# Columns the report pipeline consumes (names after standardization).
+# Everything else in the sheets is skipped at read time.
+NEEDED_COLUMNS = {"OD", "WT", "MT", "Specification", "Make", "Grade"}
+ADD_SPEC_COLUMNS = {"add_spec", "addlspec", "addl_spec", "additional_spec"}
+
+
+def is_needed_column(col) -> bool:
+    """
+    Check whether a raw sheet column is used by preprocessing or reporting.
+    Used as the read_excel usecols filter, so it sees header names before standardization.
+    """
+    name = str(col).strip().translate(_COL_TRANS)
+    if name in NEEDED_COLUMNS:
+        return True
+    # Duplicate MT headers (MT.1, MT.2, ...) - Incoming needs the 2nd MT column
+    if name.startswith("MT") and name[2:].isdigit():
+        return True
+    # Additional spec column variants (see rename_add_spec_column)
+    name_lower = name.lower()
+    return name_lower in ADD_SPEC_COLUMNS or "addlspec" in name_lower
+
 
 def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize column names: strip, replace spaces/periods/dashes with underscores.
     Copied from dashboard logic.
     """
-    df = df.copy()
-    df.columns = [str(c).strip().replace(" ", "_").replace(".", "").replace("-", "_") for c in df.columns]
+    df.columns = [str(c).strip().translate(_COL_TRANS) for c in df.columns]
     return df
 
 
@@ -38,8 +100,6 @@ def process_incoming_sheet_mt_columns(df: pd.DataFrame) -> pd.DataFrame:
     The 2nd MT column contains the correct Incoming Stock MT values.
     Copied from dashboard logic - EXACT implementation.
     """
-    df = df.copy()
-    
     try:
         # Capture original column names before standardization
         original_columns = df.columns.tolist()
@@ -47,12 +107,8 @@ def process_incoming_sheet_mt_columns(df: pd.DataFrame) -> pd.DataFrame:
         # Find columns with exact name "MT" (before pandas adds suffixes)
         # Pandas creates "MT", "MT.1", "MT.2", "MT.3" for duplicate headers
         # EXACT match to dashboard logic - case-sensitive
-        mt_column_indices = []
-        for idx, col in enumerate(original_columns):
-            col_str = str(col).strip()  # Case-sensitive like dashboard
-            # Check for exact "MT" or pandas-generated "MT.1", "MT.2", etc.
-            if col_str == "MT" or (col_str.startswith("MT.") and col_str[3:].isdigit()):
-                mt_column_indices.append(idx)
+        stripped_columns = pd.Index(original_columns).astype(str).str.strip()
+        mt_column_indices = np.flatnonzero(stripped_columns.str.fullmatch(_MT_COLUMN_RE)).tolist()
         
         # Validate: must have at least 2 MT columns
         if len(mt_column_indices) < 2:
@@ -72,33 +128,38 @@ def process_incoming_sheet_mt_columns(df: pd.DataFrame) -> pd.DataFrame:
         # After standardization, this will become "MT1" (from "MT.1")
         # So we need to track it through standardization
         # Standardize the column name to predict what it will become
-        standardized_second_mt = str(second_mt_col_original).strip().replace(" ", "_").replace(".", "").replace("-", "_")
+        standardized_second_mt = str(second_mt_col_original).strip().translate(_COL_TRANS)
         
         logger.debug(f"Incoming sheet: Standardized 2nd MT column name: '{standardized_second_mt}'")
         
         # Apply standardization
         df = standardize_column_names(df)
         
-        logger.debug(f"Incoming sheet: Columns after standardization: {df.columns.tolist()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Incoming sheet: Columns after standardization: {df.columns.tolist()}")
         
         # Now find the standardized second MT column and overwrite df["MT"]
         # EXACT match to dashboard: just copy, no numeric conversion here (happens later)
         if standardized_second_mt in df.columns:
             # Copy values directly (dashboard does this, numeric conversion happens later)
-            df["MT"] = df[standardized_second_mt].copy()
+            df["MT"] = df[standardized_second_mt]
             
-            # Log values for debugging (convert to numeric just for logging)
-            mt_sum_for_log = pd.to_numeric(df["MT"], errors='coerce').fillna(0).sum()
-            mt_non_zero = (pd.to_numeric(df["MT"], errors='coerce').fillna(0) != 0).sum()
             logger.info(f"Incoming sheet: Copied MT values from '{standardized_second_mt}' to 'MT'")
-            logger.info(f"Incoming sheet: MT column stats - Sum: {mt_sum_for_log:.2f}, Non-zero rows: {mt_non_zero}, Total rows: {len(df)}")
+            
+            # Log values for debugging (convert to numeric just for logging, skipped if INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                mt_numeric = pd.to_numeric(df["MT"], errors='coerce').fillna(0)
+                mt_sum_for_log = mt_numeric.sum()
+                mt_non_zero = (mt_numeric != 0).sum()
+                logger.info(f"Incoming sheet: MT column stats - Sum: {mt_sum_for_log:.2f}, Non-zero rows: {mt_non_zero}, Total rows: {len(df)}")
             
             # Drop all other MT columns (keep only "MT")
             # Drop columns that are MT-related: MT1, MT2, MT3, etc. (but keep "MT")
-            mt_cols_to_drop = [col for col in df.columns if col.startswith("MT") and col != "MT"]
-            if mt_cols_to_drop:
-                df = df.drop(columns=mt_cols_to_drop)
-                logger.debug(f"Incoming sheet: Dropped MT columns: {mt_cols_to_drop}")
+            drop_mask = df.columns.str.startswith("MT") & (df.columns != "MT")
+            if drop_mask.any():
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Incoming sheet: Dropped MT columns: {df.columns[drop_mask].tolist()}")
+                df = df.loc[:, ~drop_mask]
         else:
             logger.error(f"Could not find standardized MT column '{standardized_second_mt}' after processing")
             logger.error(f"Available columns: {df.columns.tolist()}")
@@ -113,18 +174,20 @@ def process_incoming_sheet_mt_columns(df: pd.DataFrame) -> pd.DataFrame:
                 if len(mt_cols) > 1:
                     # Use the 2nd one (index 1) if available - this should be the correct Incoming MT
                     logger.warning(f"Using 2nd MT column: '{mt_cols[1]}'")
-                    df["MT"] = df[mt_cols[1]].copy()
+                    df["MT"] = df[mt_cols[1]]
                     # Log stats
-                    mt_sum = pd.to_numeric(df["MT"], errors='coerce').fillna(0).sum()
-                    mt_non_zero = (pd.to_numeric(df["MT"], errors='coerce').fillna(0) != 0).sum()
+                    mt_numeric = pd.to_numeric(df["MT"], errors='coerce').fillna(0)
+                    mt_sum = mt_numeric.sum()
+                    mt_non_zero = (mt_numeric != 0).sum()
                     logger.info(f"Incoming sheet: MT column stats - Sum: {mt_sum:.2f}, Non-zero rows: {mt_non_zero}")
                 elif len(mt_cols) == 1:
                     # Only one MT column found - use it (might be wrong, but better than 0)
                     logger.warning(f"Only one MT column found, using: '{mt_cols[0]}'")
-                    df["MT"] = df[mt_cols[0]].copy()
+                    df["MT"] = df[mt_cols[0]]
                     # Log stats
-                    mt_sum = pd.to_numeric(df["MT"], errors='coerce').fillna(0).sum()
-                    mt_non_zero = (pd.to_numeric(df["MT"], errors='coerce').fillna(0) != 0).sum()
+                    mt_numeric = pd.to_numeric(df["MT"], errors='coerce').fillna(0)
+                    mt_sum = mt_numeric.sum()
+                    mt_non_zero = (mt_numeric != 0).sum()
                     logger.info(f"Incoming sheet: MT column stats - Sum: {mt_sum:.2f}, Non-zero rows: {mt_non_zero}")
             else:
                 logger.error(f"No MT columns found in Incoming sheet after standardization!")
@@ -145,10 +208,8 @@ def rename_add_spec_column(df: pd.DataFrame) -> pd.DataFrame:
     Standardize additional spec column names to "Add_Spec" for all sheets.
     Copied from dashboard logic.
     """
-    df = df.copy()
-    
     # Standardize additional spec column names to "Add_Spec" for all sheets
-    add_spec_columns = [c for c in df.columns if c.lower() in ["add_spec", "addlspec", "addl_spec", "additional_spec"]]
+    add_spec_columns = [c for c in df.columns if c.lower() in ADD_SPEC_COLUMNS]
     # Also check for the standardized version (AddlSpec becomes AddlSpec after dot removal)
     if not add_spec_columns:
         add_spec_columns = [c for c in df.columns if "addlspec" in c.lower()]
@@ -165,104 +226,76 @@ def add_grade_columns(df: pd.DataFrame) -> pd.DataFrame:
     Add Grade and Grade_Logic columns derived from Specification.
     Copied from dashboard logic.
     """
-    df = df.copy()
-    
-    if derive_grade_from_spec is None:
-        logger.warning("derive_grade_from_spec not available. Skipping grade derivation.")
+    if derive_grades_from_specs is None:
+        logger.warning("derive_grades_from_specs not available. Skipping grade derivation.")
         return df
     
-    # Optimized Grade derivation using vectorized operations
+    # Optimized Grade derivation: specifications repeat heavily, so factorize them
+    # once, derive each grade per unique value and broadcast back by integer code.
+    # Missing specs get code -1, which picks the trailing "Unknown" entry.
     if 'Grade' not in df.columns and 'Specification' in df.columns:
+        spec_codes, unique_specs = pd.factorize(df['Specification'])
+        
         # Add Grade column derived from Specification (for display)
-        df['Grade'] = df['Specification'].apply(lambda x: derive_grade_from_spec(x, combine_cs_as=False))
+        grades = np.append(
+            derive_grades_from_specs(unique_specs, combine_cs_as=False), "Unknown"
+        )
+        df['Grade'] = grades[spec_codes]
         
         # Add Grade_Logic column for internal categorization (CS & AS combined)
-        df['Grade_Logic'] = df['Specification'].apply(lambda x: derive_grade_from_spec(x, combine_cs_as=True))
+        grade_logics = np.append(
+            derive_grades_from_specs(unique_specs, combine_cs_as=True), "Unknown"
+        )
+        df['Grade_Logic'] = grade_logics[spec_codes]
     
     return df
 
 
-def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def normalize_sheet_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Basic data cleaning: remove empty rows, fill NaN with empty string.
-    Copied from dashboard logic.
-    """
-    df = df.copy()
-    
-    # Optimized data cleaning using vectorized operations
-    df = df.dropna(how='all')  # Remove completely empty rows
-    df = df.fillna('')  # Fill NaN values with empty string
-    
-    return df
-
-
-def normalize_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Convert OD, WT, MT to numeric and normalize precision.
-    Copied from dashboard logic used before heatmap generation.
-    """
-    df = df.copy()
-    
-    # Convert OD and WT to numeric, handling any non-numeric values
-    if 'OD' in df.columns:
-        df['OD'] = pd.to_numeric(df['OD'], errors='coerce')
-        # Round to 3 decimal places to match filter options and prevent floating-point precision mismatches
-        df['OD'] = df['OD'].round(3)
-    
-    if 'WT' in df.columns:
-        df['WT'] = pd.to_numeric(df['WT'], errors='coerce')
-        # Round to 3 decimal places
-        df['WT'] = df['WT'].round(3)
-    
-    # Convert MT to numeric as well (treat blanks/invalid as 0 for aggregation)
-    if 'MT' in df.columns:
-        df['MT'] = pd.to_numeric(df['MT'], errors='coerce').fillna(0)
+    Basic cleaning and normalization of a sheet in a single pass over its columns.
     
-    return df
-
-
-def normalize_specification_column(df: pd.DataFrame) -> pd.DataFrame:
+    Applies the dashboard's cleaning steps - remove empty rows, fill NaN with
+    empty string, numeric OD/WT/MT, categorical Make/Grade, normalized Specification -
+    but visits each column once instead of re-scanning the frame per step.
     """
-    Normalize Specification column: convert to string, replace 'nan', strip spaces.
-    Copied from dashboard logic.
-    """
-    df = df.copy()
+    # Remove completely empty rows
+    df = df.dropna(how='all')
     
-    if 'Specification' in df.columns:
-        # Convert to string
-        df['Specification'] = df['Specification'].astype(str)
-        
-        # Replace string 'nan' with empty string
-        df['Specification'] = df['Specification'].replace('nan', '')
+    # Walk columns by position so duplicate labels cannot break the dispatch
+    for position, col in enumerate(df.columns):
+        series = df.iloc[:, position]
         
-        # Strip leading/trailing spaces (e.g., 'STD ' → 'STD')
-        df['Specification'] = df['Specification'].str.strip()
+        if col in ('OD', 'WT'):
+            # Convert to numeric and round to 3 decimal places to match filter options
+            # and prevent floating-point precision mismatches
+            series = pd.to_numeric(series, errors='coerce').round(3)
+        elif col == 'MT':
+            # Treat blanks/invalid as 0 for aggregation
+            series = pd.to_numeric(series, errors='coerce').fillna(0)
+        elif col == 'Specification':
+            # Cast once to a native string dtype, replace 'nan', strip spaces
+            # (e.g., 'STD ' → 'STD') and mark empty values as missing. Hand the
+            # result back as object dtype with None for missing values, as the
+            # dashboard does - callers such as calculate_free_for_sale() group
+            # on astype(str), where pd.NA would become '<NA>' instead of 'None'
+            series = series.astype(SPECIFICATION_DTYPE).replace('nan', pd.NA).str.strip()
+            series = series.replace('', pd.NA)
+            series = series.astype(object).where(series.notna(), None)
+        elif col in ('Make', 'Grade'):
+            # Convert to string to ensure consistent grouping; low-cardinality,
+            # so store as categorical to group on integer codes
+            series = series.fillna('').astype(str).astype('category')
+        else:
+            series = series.fillna('')
         
-        # Replace empty strings with None for consistency
-        df['Specification'] = df['Specification'].replace('', None)
-    
-    return df
-
-
-def normalize_string_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Convert Make and Grade columns to string for consistent grouping.
-    Copied from dashboard logic.
-    """
-    df = df.copy()
-    
-    # Convert Make and Grade to string to ensure consistent grouping
-    if 'Make' in df.columns:
-        df['Make'] = df['Make'].astype(str)
-    
-    if 'Grade' in df.columns:
-        df['Grade'] = df['Grade'].astype(str)
+        df.isetitem(position, series)
     
     return df
 
 
 def preprocess_inventory_sheet(
-    xls: pd.ExcelFile,
+    df: pd.DataFrame,
     sheet_name: str
 ) -> pd.DataFrame:
     """
@@ -271,24 +304,21 @@ def preprocess_inventory_sheet(
     This function applies the EXACT same preprocessing logic as the dashboard.
     
     Args:
-        xls: ExcelFile object
+        df: Raw DataFrame read from the sheet (header row already applied)
         sheet_name: Name of the sheet to process ("Stock", "Incoming", or "Reservations")
     
     Returns:
         Preprocessed DataFrame ready for heatmap generation
     """
-    if sheet_name not in xls.sheet_names:
+    if df is None:
         logger.warning(f"Sheet '{sheet_name}' not found in Excel file")
         return pd.DataFrame()
     
     try:
-        # Step 1: Read with fixed header row (Excel row 2 = pandas header=1)
-        # All sheets (Stock, Reservations, Incoming) use header row 1 - fixed format
-        header_row = 1
-        df = pd.read_excel(xls, sheet_name=sheet_name, header=header_row)
-        
-        logger.debug(f"Preprocessing {sheet_name}: Read {len(df)} rows with header row {header_row}")
-        logger.debug(f"Preprocessing {sheet_name}: Initial columns: {df.columns.tolist()[:10]}...")  # First 10 columns
+        # Step 1: Sheet was already read by preprocess_inventory_data()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Preprocessing {sheet_name}: Read {len(df)} rows")
+            logger.debug(f"Preprocessing {sheet_name}: Initial columns: {df.columns.tolist()[:10]}...")  # First 10 columns
         
         # Step 2: Handle Incoming sheet MT columns (must be done before column standardization)
         if sheet_name == "Incoming":
@@ -303,8 +333,9 @@ def preprocess_inventory_sheet(
             
             # Verify MT column exists and has values after processing
             if 'MT' in df.columns:
-                mt_sum = pd.to_numeric(df['MT'], errors='coerce').fillna(0).sum()
-                logger.info(f"Incoming sheet: MT column sum after processing: {mt_sum:.2f}")
+                if logger.isEnabledFor(logging.INFO):
+                    mt_sum = pd.to_numeric(df['MT'], errors='coerce').fillna(0).sum()
+                    logger.info(f"Incoming sheet: MT column sum after processing: {mt_sum:.2f}")
             else:
                 logger.warning(f"Incoming sheet: MT column missing after processing!")
         else:
@@ -317,22 +348,14 @@ def preprocess_inventory_sheet(
         # Step 5: Add Grade columns
         df = add_grade_columns(df)
         
-        # Step 6: Basic cleaning
-        df = clean_dataframe(df)
+        # Step 6: Basic cleaning and normalization (OD, WT, MT, Make, Grade, Specification)
+        df = normalize_sheet_columns(df)
         
-        # Step 7: Normalize numeric columns (OD, WT, MT)
-        df = normalize_numeric_columns(df)
-        
-        # Step 8: Normalize string columns (Make, Grade)
-        df = normalize_string_columns(df)
-        
-        # Step 9: Normalize Specification column
-        df = normalize_specification_column(df)
-        
-        # Step 10: Final verification - ensure MT column is numeric (especially for Incoming)
+        # Step 7: Final verification - log MT stats (especially for Incoming)
         if sheet_name == "Incoming" and 'MT' in df.columns:
-            # Double-check MT column is numeric and log stats
-            df['MT'] = pd.to_numeric(df['MT'], errors='coerce').fillna(0)
+            # normalize_sheet_columns() already coerced MT; only re-cast if that somehow didn't stick
+            if not pd.api.types.is_numeric_dtype(df['MT']):
+                df['MT'] = pd.to_numeric(df['MT'], errors='coerce').fillna(0)
             mt_sum = df['MT'].sum()
             mt_non_zero = (df['MT'] != 0).sum()
             logger.info(f"Incoming sheet final check - MT Sum: {mt_sum:.2f}, Non-zero rows: {mt_non_zero}/{len(df)}")
@@ -361,8 +384,12 @@ def preprocess_inventory_data(file_path: str) -> dict:
         Dictionary with keys: 'Stock', 'Reservations', 'Incoming'
         Each value is a preprocessed pandas DataFrame
     """
+    engine_kwargs = None
+    if EXCEL_ENGINE is None and str(file_path).lower().endswith(".xlsx"):
+        engine_kwargs = OPENPYXL_ENGINE_KWARGS
+    
     try:
-        xls = pd.ExcelFile(file_path)
+        xls = pd.ExcelFile(file_path, engine=EXCEL_ENGINE, engine_kwargs=engine_kwargs)
     except Exception as e:
         raise ValueError(f"Failed to open Excel file: {str(e)}")
     
@@ -372,11 +399,129 @@ def preprocess_inventory_data(file_path: str) -> dict:
     if missing_sheets:
         raise ValueError(f"Missing required sheets: {missing_sheets}")
     
-    sheets = {}
+    # Read all sheets in one call with fixed header row (Excel row 2 = pandas header=1)
+    # All sheets (Stock, Reservations, Incoming) use header row 1 - fixed format.
+    # A single read shares the workbook's shared-strings and styles parsing
+    # across sheets instead of repeating it per sheet; unused columns are skipped.
+    try:
+        raw_sheets = pd.read_excel(xls, sheet_name=required_sheets, header=1, usecols=is_needed_column)
+    except Exception as e:
+        raise ValueError(f"Failed to read Excel sheets: {str(e)}")
     
-    for sheet_name in required_sheets:
-        df = preprocess_inventory_sheet(xls, sheet_name)
-        sheets[sheet_name] = df
+    # Sheets are independent, so preprocess them concurrently - most of the work
+    # is in pandas/numpy kernels that release the GIL
+    with ThreadPoolExecutor(max_workers=len(required_sheets)) as executor:
+        futures = {
+            sheet_name: executor.submit(preprocess_inventory_sheet, raw_sheets.get(sheet_name), sheet_name)
+            for sheet_name in required_sheets
+        }
+        sheets = {sheet_name: future.result() for sheet_name, future in futures.items()}
     
     return sheets
 
+
+# Version of the preprocessed-sheet cache format. Part of the cache key, so
+# bump it whenever the preprocessing logic (or the way sheets are written
+# to the cache) changes - older entries are then ignored and rebuilt.
+PREPROCESSED_CACHE_VERSION = 3
+
+
+def _preprocessed_cache_key(file_path: str) -> str:
+    """
+    Cache key for the preprocessed sheets of an Excel file.
+    
+    Hashes PREPROCESSED_CACHE_VERSION and the workbook's bytes, plus the
+    modification time and size of the specification mapping file the Grade
+    columns are derived from.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{PREPROCESSED_CACHE_VERSION}:".encode())
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    if SPECIFICATION_MAPPING_FILE:
+        try:
+            mapping_stat = os.stat(SPECIFICATION_MAPPING_FILE)
+            digest.update(f"{mapping_stat.st_mtime_ns}:{mapping_stat.st_size}".encode())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _parquet_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make object columns writable as Parquet.
+    
+    Pass-through columns are filled with '' by normalize_sheet_columns(), so a
+    column holding numbers next to blanks mixes int/float and str values,
+    which Arrow cannot store in one column. The non-missing values of such
+    mixed columns are cast to str; the reporting pipeline only reads the typed
+    OD/WT/MT/Make/Grade columns and Specification (str or None, which Arrow
+    stores as is).
+    """
+    mixed_cols = [
+        col for col in df.columns[df.dtypes == object]
+        if df[col].dropna().map(type).nunique() > 1
+    ]
+    if mixed_cols:
+        df = df.assign(**{
+            col: df[col].where(df[col].isna(), df[col].astype(str))
+            for col in mixed_cols
+        })
+    return df
+
+
+def _write_preprocessed_cache(sheets: dict, cache_paths: dict, cache_key: str) -> None:
+    """Write preprocessed sheets to the Parquet cache (best effort), replacing older entries."""
+    try:
+        os.makedirs(PREPROCESSED_CACHE_DIR, exist_ok=True)
+        # Only the latest workbook is worth keeping
+        for name in os.listdir(PREPROCESSED_CACHE_DIR):
+            if name.endswith('.parquet') and not name.startswith(cache_key):
+                os.remove(os.path.join(PREPROCESSED_CACHE_DIR, name))
+        for sheet_name, path in cache_paths.items():
+            temp_path = f"{path}.tmp"
+            _parquet_safe(sheets[sheet_name]).to_parquet(temp_path)
+            os.replace(temp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write preprocessed data cache: {e}")
+
+
+def load_inventory_data(file_path: str) -> dict:
+    """
+    preprocess_inventory_data() with the result cached as Parquet.
+    
+    Re-running the pipeline on the same workbook (re-sends, debugging) reads
+    the preprocessed sheets back from PREPROCESSED_CACHE_DIR instead of
+    parsing and preprocessing the Excel file again.
+    
+    Args:
+        file_path: Path to Excel file
+    
+    Returns:
+        Dictionary with keys: 'Stock', 'Reservations', 'Incoming'
+        Each value is a preprocessed pandas DataFrame
+    """
+    try:
+        cache_key = _preprocessed_cache_key(file_path)
+    except OSError:
+        # Let preprocess_inventory_data() report the unreadable file
+        return preprocess_inventory_data(file_path)
+    
+    cache_paths = {
+        sheet_name: os.path.join(PREPROCESSED_CACHE_DIR, f"{cache_key}_{sheet_name}.parquet")
+        for sheet_name in ("Stock", "Reservations", "Incoming")
+    }
+    if all(os.path.exists(path) for path in cache_paths.values()):
+        try:
+            sheets = {sheet_name: pd.read_parquet(path) for sheet_name, path in cache_paths.items()}
+            logger.info(f"Loaded preprocessed inventory data from cache ({cache_key})")
+            return sheets
+        except Exception as e:
+            logger.warning(f"Could not read preprocessed data cache: {e}")
+    
+    sheets = preprocess_inventory_data(file_path)
+    # A sheet that failed to preprocess comes back empty; do not cache that
+    if all(not df.empty for df in sheets.values()):
+        _write_preprocessed_cache(sheets, cache_paths, cache_key)
+    return sheets
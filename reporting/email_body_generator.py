@@ -18,12 +18,92 @@ from datetime import datetime
 from typing import Optional
 import pandas as pd
 
-from reporting.config import PDF_SPECIFICATIONS, ERP_SYSTEM_LINK, DATE_FORMAT_DISPLAY
+from reporting.config import PDF_SPECIFICATIONS
 from reporting.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# ============================================================================
+# HTML Template
+# ============================================================================
+
+# The email scaffolding is static apart from a few values, so it is rendered
+# once at import time and only the variable parts are filled in per call.
+
+# PDF specifications list (bullet points) - fixed for every report
+_PDF_SPECS_HTML = "".join(f"<li>{spec}</li>" for spec in PDF_SPECIFICATIONS)
+
+# Everything before the priority table rows (placeholders: greeting, date_str)
+_HTML_HEAD_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333; margin: 0; padding: 20px;">
+    
+    <p>{greeting}</p>
+    
+    <h2 style="color: #2c3e50; margin-top: 20px; margin-bottom: 10px;">Inventory Report - Priority Items for Sales Focus</h2>
+    <p style="color: #666; margin-bottom: 20px;"><strong>{date_str}</strong></p>
+    
+    <p>This report highlights inventory items that currently require priority sales focus based on available Free-For-Sale quantities.</p>
+    
+    <p>The information shared below represents a point-in-time snapshot of inventory as of the date mentioned above.</p>
+    
+    <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px; border: 1px solid #ddd;">
+        <thead>
+            <tr style="background-color: #333; color: white;">
+                <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Specification</th>
+                <th style="padding: 10px; border: 1px solid #ddd; text-align: right;">Free-For-Sale (MT)</th>
+            </tr>
+        </thead>
+        <tbody>
+            """
+
+# Everything after the priority table rows (placeholder: erp_url)
+_HTML_TAIL_TEMPLATE = f"""
+        </tbody>
+    </table>
+    
+    <p style="margin-top: 20px; margin-bottom: 20px;">
+        <strong>Note:</strong><br>
+        Items are ordered from highest to lowest available inventory, indicating increasing urgency for sales focus.<br>
+        This snapshot of inventory data is as of the date mentioned above.
+    </p>
+    
+    <p style="margin-top: 20px; margin-bottom: 20px;">
+        For real-time inventory levels, reservations, and incoming stock updates, please refer to the ERP system using the link below:
+    </p>
+    
+    <p style="margin-top: 10px; margin-bottom: 20px;">
+        <a href="{{erp_url}}" style="color: #0066cc; text-decoration: none; font-weight: bold;">View Live Inventory in ERP →</a>
+    </p>
+    
+    <p style="margin-top: 30px; margin-bottom: 10px;">
+        Attached to this email are detailed inventory reports providing a breakdown of Free-For-Sale stock across schedules and categories for the following grades:
+    </p>
+    
+    <ul style="margin-top: 10px; margin-bottom: 20px; padding-left: 20px;">
+        {_PDF_SPECS_HTML}
+    </ul>
+    
+    <p style="margin-top: 30px; margin-bottom: 5px;">
+        Regards,<br>
+        <strong>Evergreen Analytics</strong>
+    </p>
+    
+    <p style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #eee; color: #666; font-size: 12px;">
+        <em>This is a system-generated email. For the latest and most accurate data, please rely on the ERP as the source of truth.</em>
+    </p>
+    
+</body>
+</html>
+"""
+
+
 def format_date_for_email(date_value: datetime) -> str:
     """
     Format date value for email display (DD MMM YYYY).
@@ -49,17 +129,13 @@ def format_number_for_email(value: float) -> str:
     Example: 1234.56 -> "1,234.56"
     
     Args:
-        value: Numeric value
+        value: Numeric value (callers coerce to numeric and fill NaN with 0 in bulk)
     
     Returns:
         Formatted string with thousand separators
     """
-    try:
-        num_value = float(value)
-        # Format with thousand separators and 2 decimal places
-        return f"{num_value:,.2f}"
-    except (ValueError, TypeError):
-        return "0.00"
+    # Format with thousand separators and 2 decimal places
+    return f"{value:,.2f}"
 
 
 def generate_email_subject(report_date: datetime) -> str:
@@ -125,16 +201,22 @@ def generate_inventory_email_body(
         greeting = "Hi there,"
     
     # Generate priority items table rows
-    table_rows = []
-    for _, row in display_df.iterrows():
-        spec = str(row['Specification']).strip()
-        mt_value = format_number_for_email(row['Total_Free_For_Sale_MT'])
-        
-        table_rows.append(f"""
+    # Clean and format whole columns up front, then zip plain lists (no iterrows).
+    # Plain str.strip over a list beats the .str accessor on a column this short.
+    specs = [spec.strip() for spec in display_df['Specification'].astype(str).tolist()]
+    mt_values = [
+        format_number_for_email(value)
+        for value in pd.to_numeric(display_df['Total_Free_For_Sale_MT'], errors='coerce').fillna(0).tolist()
+    ]
+    
+    table_rows = [
+        f"""
         <tr>
             <td style="padding: 8px; border: 1px solid #ddd;">{spec}</td>
             <td style="padding: 8px; border: 1px solid #ddd; text-align: right;">{mt_value}</td>
-        </tr>""")
+        </tr>"""
+        for spec, mt_value in zip(specs, mt_values)
+    ]
     
     # If no items, add a placeholder row
     if not table_rows:
@@ -147,74 +229,12 @@ def generate_inventory_email_body(
     
     table_rows_html = "".join(table_rows)
     
-    # Generate PDF specifications list (bullet points)
-    pdf_specs_list = "".join([f"<li>{spec}</li>" for spec in PDF_SPECIFICATIONS])
-    
-    # Build HTML email body
-    html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333; margin: 0; padding: 20px;">
-    
-    <p>{greeting}</p>
-    
-    <h2 style="color: #2c3e50; margin-top: 20px; margin-bottom: 10px;">Inventory Report - Priority Items for Sales Focus</h2>
-    <p style="color: #666; margin-bottom: 20px;"><strong>{date_str}</strong></p>
-    
-    <p>This report highlights inventory items that currently require priority sales focus based on available Free-For-Sale quantities.</p>
-    
-    <p>The information shared below represents a point-in-time snapshot of inventory as of the date mentioned above.</p>
-    
-    <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px; border: 1px solid #ddd;">
-        <thead>
-            <tr style="background-color: #333; color: white;">
-                <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Specification</th>
-                <th style="padding: 10px; border: 1px solid #ddd; text-align: right;">Free-For-Sale (MT)</th>
-            </tr>
-        </thead>
-        <tbody>
-            {table_rows_html}
-        </tbody>
-    </table>
-    
-    <p style="margin-top: 20px; margin-bottom: 20px;">
-        <strong>Note:</strong><br>
-        Items are ordered from highest to lowest available inventory, indicating increasing urgency for sales focus.<br>
-        This snapshot of inventory data is as of the date mentioned above.
-    </p>
-    
-    <p style="margin-top: 20px; margin-bottom: 20px;">
-        For real-time inventory levels, reservations, and incoming stock updates, please refer to the ERP system using the link below:
-    </p>
-    
-    <p style="margin-top: 10px; margin-bottom: 20px;">
-        <a href="{erp_url}" style="color: #0066cc; text-decoration: none; font-weight: bold;">View Live Inventory in ERP →</a>
-    </p>
-    
-    <p style="margin-top: 30px; margin-bottom: 10px;">
-        Attached to this email are detailed inventory reports providing a breakdown of Free-For-Sale stock across schedules and categories for the following grades:
-    </p>
-    
-    <ul style="margin-top: 10px; margin-bottom: 20px; padding-left: 20px;">
-        {pdf_specs_list}
-    </ul>
-    
-    <p style="margin-top: 30px; margin-bottom: 5px;">
-        Regards,<br>
-        <strong>Evergreen Analytics</strong>
-    </p>
-    
-    <p style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #eee; color: #666; font-size: 12px;">
-        <em>This is a system-generated email. For the latest and most accurate data, please rely on the ERP as the source of truth.</em>
-    </p>
-    
-</body>
-</html>
-"""
+    # Build HTML email body from the pre-rendered template
+    html_body = (
+        _HTML_HEAD_TEMPLATE.format(greeting=greeting, date_str=date_str)
+        + table_rows_html
+        + _HTML_TAIL_TEMPLATE.format(erp_url=erp_url)
+    )
     
     logger.info(f"Generated HTML email body ({len(html_body)} characters)")
     logger.debug(f"Email body includes {len(display_df)} priority items")
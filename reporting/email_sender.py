@@ -7,30 +7,414 @@ This is a pure infrastructure module - no email content generation logic.
 Uses SMTP for email delivery with support for:
 - HTML email body
 - Optional file attachments (PDF)
-- Multiple recipients with delay between sends
+- Multiple recipients in one Bcc transaction, or concurrent per-recipient sends,
+  over a small pool of reused SMTP connections
+- Token-bucket rate limiting of outgoing messages
 - Environment variable-based configuration
 """
 
+import logging
 import os
+import queue
 import smtplib
+import socket
+import stat
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
+from email import policy
 
-from reporting.config import EMAIL_DELAY_SECONDS, DEFAULT_SMTP_PORT
+from reporting.config import (
+    DEFAULT_SMTP_PORT,
+    MAX_MESSAGES_PER_CONNECTION,
+    SMTP_POOL_SIZE,
+    EARLY_ABORT_MIN_RECIPIENTS,
+    RATE_LIMIT_MSGS,
+    RATE_LIMIT_WINDOW_SEC,
+)
 from reporting.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class SMTPConfigError(ValueError):
+    """Raised when a required SMTP environment variable is missing or invalid."""
+
+
+@dataclass(frozen=True)
+class _SMTPConfig:
+    """SMTP connection settings read from the environment."""
+    server: str
+    port: int
+    user: str
+    password: str
+
+
+@lru_cache(maxsize=1)
+def _smtp_config() -> _SMTPConfig:
+    """
+    Read the SMTP configuration from environment variables once per process.
+    
+    Returns:
+        _SMTPConfig with server, port, user and password
+    
+    Raises:
+        SMTPConfigError: If SMTP_SERVER, SMTP_USER or SMTP_PASSWORD is not set,
+                         or SMTP_PORT is not an integer (failures are not cached)
+    """
+    smtp_server = os.getenv('SMTP_SERVER')
+    smtp_user = os.getenv('SMTP_USER')
+    smtp_password = os.getenv('SMTP_PASSWORD')
+    
+    if not smtp_server:
+        raise SMTPConfigError("SMTP_SERVER environment variable is not set")
+    if not smtp_user:
+        raise SMTPConfigError("SMTP_USER environment variable is not set")
+    if not smtp_password:
+        raise SMTPConfigError("SMTP_PASSWORD environment variable is not set")
+    
+    try:
+        smtp_port = int(os.getenv('SMTP_PORT', DEFAULT_SMTP_PORT))
+    except ValueError:
+        raise SMTPConfigError(f"SMTP_PORT environment variable is not a valid port: {os.getenv('SMTP_PORT')}")
+    
+    return _SMTPConfig(server=smtp_server, port=smtp_port, user=smtp_user, password=smtp_password)
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    Holds up to `capacity` tokens, refilled continuously at capacity/window_seconds
+    per second. acquire() takes one token and only sleeps when the bucket is empty.
+    """
+    
+    def __init__(self, capacity: int, window_seconds: float):
+        self.capacity = max(1, capacity)
+        self.refill_rate = self.capacity / window_seconds
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, waiting for a refill if none is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.refill_rate
+            logger.debug(f"Rate limit reached. Waiting {wait_seconds:.2f} seconds before next email")
+            time.sleep(wait_seconds)
+
+
+# Shared across send_email calls so the provider limit holds for the whole process
+_send_rate_limiter = TokenBucket(RATE_LIMIT_MSGS, RATE_LIMIT_WINDOW_SEC)
+
+
+# Serialization policy matching SMTP.send_message: the message's own compat32
+# policy with CRLF line endings
+_SMTP_POLICY = policy.compat32.clone(linesep='\r\n')
+
+
+@lru_cache(maxsize=8)
+def _resolve_smtp_host(host: str, port: int) -> tuple:
+    """
+    Resolve an SMTP server address once per process.
+    
+    Args:
+        host: SMTP server hostname
+        port: SMTP port
+    
+    Returns:
+        All getaddrinfo() entries, in resolver order:
+        (family, type, proto, canonname, sockaddr) tuples
+    """
+    return tuple(socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM))
+
+
+def _connect_first(addresses: tuple, timeout, source_address) -> socket.socket:
+    """
+    Connect to the first reachable address, trying each one in order like
+    socket.create_connection does.
+    
+    Args:
+        addresses: getaddrinfo() entries from _resolve_smtp_host
+        timeout: Socket timeout (or socket._GLOBAL_DEFAULT_TIMEOUT)
+        source_address: Optional (host, port) to bind to
+    
+    Returns:
+        Connected socket
+    
+    Raises:
+        OSError: The error from the last address if none could be reached
+    """
+    last_error = None
+    for family, socktype, proto, _, sockaddr in addresses:
+        sock = None
+        try:
+            sock = socket.socket(family, socktype, proto)
+            if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            last_error = e
+            if sock is not None:
+                sock.close()
+    raise last_error if last_error is not None else OSError("getaddrinfo returned no addresses")
+
+
+class _CachedAddressSMTP(smtplib.SMTP):
+    """
+    smtplib.SMTP that connects to the addresses cached by _resolve_smtp_host, so
+    pooled and rotated connections skip the DNS lookup. The hostname is still
+    used for STARTTLS certificate checks.
+    """
+    
+    def _get_socket(self, host, port, timeout):
+        addresses = _resolve_smtp_host(host, port)
+        try:
+            return _connect_first(addresses, timeout, self.source_address)
+        except OSError:
+            # The cached addresses may be stale - resolve afresh, and retry only
+            # if DNS now gives different addresses
+            _resolve_smtp_host.cache_clear()
+            fresh_addresses = _resolve_smtp_host(host, port)
+            if fresh_addresses == addresses:
+                raise
+            return _connect_first(fresh_addresses, timeout, self.source_address)
+
+
+def _open_smtp_connection(
+    smtp_server: str,
+    smtp_port: int,
+    smtp_user: str,
+    smtp_password: str
+) -> smtplib.SMTP:
+    """
+    Open an authenticated SMTP connection (TCP connect, STARTTLS, login).
+    
+    Args:
+        smtp_server: SMTP server address
+        smtp_port: SMTP port
+        smtp_user: SMTP username
+        smtp_password: SMTP password
+    
+    Returns:
+        Connected and logged-in smtplib.SMTP instance
+    """
+    server = _CachedAddressSMTP(smtp_server, smtp_port)
+    try:
+        server.starttls()  # Enable TLS encryption
+        server.login(smtp_user, smtp_password)
+    except Exception:
+        server.close()
+        raise
+    logger.debug(f"Opened SMTP connection to {smtp_server}:{smtp_port}")
+    return server
+
+
+def _close_smtp_connection(server: Optional[smtplib.SMTP]) -> None:
+    """Politely close an SMTP connection, ignoring errors from an already-dropped socket."""
+    if server is None:
+        return
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+class _SMTPConnectionPool:
+    """
+    Fixed-size pool of authenticated SMTP connections shared by send workers.
+    
+    Connections are opened lazily on first use, rotated after
+    MAX_MESSAGES_PER_CONNECTION sends, re-opened once if the server drops them,
+    and all closed when the pool is exited.
+    """
+    
+    def __init__(self, smtp_config: _SMTPConfig, size: int):
+        self._connection_args = (smtp_config.server, smtp_config.port, smtp_config.user, smtp_config.password)
+        self._smtp_user = smtp_config.user
+        # Each slot is [connection or None, messages sent on it]
+        self._slots = [[None, 0] for _ in range(max(1, size))]
+        self._idle = queue.Queue()
+        for slot in self._slots:
+            self._idle.put(slot)
+    
+    def __enter__(self) -> "_SMTPConnectionPool":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        for slot in self._slots:
+            _close_smtp_connection(slot[0])
+            slot[0] = None
+    
+    def send(self, message: bytes, recipients: List[str]) -> dict:
+        """
+        Send a serialized message on a borrowed connection.
+        
+        Args:
+            message: Message bytes with CRLF line endings
+            recipients: Envelope recipients
+        
+        Returns:
+            Dict of recipients refused by the server (empty if all accepted)
+        """
+        slot = self._idle.get()
+        try:
+            # Rotate the connection every MAX_MESSAGES_PER_CONNECTION sends
+            if slot[0] is not None and slot[1] >= MAX_MESSAGES_PER_CONNECTION:
+                logger.debug(f"Rotating SMTP connection after {slot[1]} messages")
+                _close_smtp_connection(slot[0])
+                slot[0] = None
+            if slot[0] is None:
+                slot[0] = _open_smtp_connection(*self._connection_args)
+                slot[1] = 0
+            
+            # Reconnect once if the server dropped the connection
+            try:
+                refused = slot[0].sendmail(self._smtp_user, recipients, message)
+            except (smtplib.SMTPServerDisconnected, ConnectionResetError):
+                logger.warning("SMTP connection dropped. Reconnecting and retrying once.")
+                _close_smtp_connection(slot[0])
+                slot[0] = None
+                slot[0] = _open_smtp_connection(*self._connection_args)
+                slot[1] = 0
+                refused = slot[0].sendmail(self._smtp_user, recipients, message)
+            slot[1] += 1
+            return refused
+        finally:
+            self._idle.put(slot)
+
+
+@lru_cache(maxsize=32)
+def _encoded_attachment(attachment_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a file and return its base64-encoded payload.
+    
+    Keyed by modification time and size as well as path, so a rewritten file
+    is re-read while an unchanged one is encoded once per process.
+    
+    Args:
+        attachment_path: Path to the file to encode
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+    
+    Returns:
+        Base64-encoded file content, as produced by email.encoders.encode_base64
+    """
+    with open(attachment_path, 'rb') as f:
+        encoded = MIMEBase('application', 'octet-stream')
+        encoded.set_payload(f.read())
+    
+    encoders.encode_base64(encoded)
+    return encoded.get_payload()
+
+
+def _build_attachment_part(attachment_path: str, stat_result: Optional[os.stat_result] = None) -> MIMEBase:
+    """
+    Wrap a file as a base64-encoded MIME attachment part.
+    
+    Args:
+        attachment_path: Path to the file to attach
+        stat_result: os.stat() of the file if already taken (stat'ed here otherwise)
+    
+    Returns:
+        MIMEBase part with Content-Disposition set to the file name
+    """
+    if stat_result is None:
+        stat_result = os.stat(attachment_path)
+    attachment = MIMEBase('application', 'octet-stream')
+    attachment.set_payload(
+        _encoded_attachment(attachment_path, stat_result.st_mtime_ns, stat_result.st_size)
+    )
+    attachment['Content-Transfer-Encoding'] = 'base64'
+    
+    # Get filename from path
+    filename = os.path.basename(attachment_path)
+    # Properly formatted Content-Disposition header
+    # No leading spaces; filename safely quoted
+    attachment.add_header(
+        'Content-Disposition',
+        f'attachment; filename="{filename}"'
+    )
+    
+    logger.debug(f"Attached file: {filename}")
+    return attachment
+
+
+def _build_root_message(
+    from_addr: str,
+    to_header: Optional[str],
+    subject: str,
+    alternative_part: MIMEMultipart,
+    attachment_parts: List[MIMEBase]
+) -> MIMEMultipart:
+    """
+    Assemble the multipart/mixed root around the shared body and attachment parts.
+    
+    Args:
+        from_addr: From header value
+        to_header: To header value, or None to leave it out (see _prepend_to_header)
+        subject: Email subject line
+        alternative_part: Pre-built multipart/alternative body container
+        attachment_parts: Pre-built attachment parts
+    
+    Returns:
+        MIMEMultipart message ready to send
+    """
+    # Root container for entire message (supports attachments)
+    mixed_msg = MIMEMultipart('mixed')
+    mixed_msg['From'] = from_addr
+    if to_header is not None:
+        mixed_msg['To'] = to_header
+    mixed_msg['Subject'] = subject
+
+    # Attach the shared body container and attachments to the root
+    mixed_msg.attach(alternative_part)
+    for attachment in attachment_parts:
+        mixed_msg.attach(attachment)
+    
+    return mixed_msg
+
+
+def _prepend_to_header(message_bytes: bytes, to_header: str) -> bytes:
+    """
+    Add a To header to a message serialized without one.
+    
+    Lets per-recipient sends share one serialization of the whole MIME tree
+    instead of flattening it again for every recipient.
+    
+    Args:
+        message_bytes: Message serialized with _SMTP_POLICY and no To header
+        to_header: To header value
+    
+    Returns:
+        Message bytes starting with the folded To header
+    """
+    return _SMTP_POLICY.fold_binary('To', to_header) + message_bytes
+
+
 def send_email(
     to_emails: List[str],
     subject: str,
     html_body: str,
-    attachments: Optional[List[str]] = None
+    attachments: Optional[List[str]] = None,
+    use_bcc: bool = False
 ) -> Tuple[bool, Optional[str]]:
     """
     Send HTML email with optional PDF attachments to multiple recipients.
@@ -38,7 +422,8 @@ def send_email(
     This function:
     1. Validates email addresses and attachment paths
     2. Reads SMTP credentials from environment variables
-    3. Sends email to each recipient with a delay between sends
+    3. Sends one message to all recipients as Bcc, or one message per recipient,
+       within the configured rate limit
     4. Returns success status and error message if any
     
     Args:
@@ -46,6 +431,10 @@ def send_email(
         subject: Email subject line
         html_body: HTML content for email body
         attachments: Optional list of file paths to attach (typically PDF files)
+        use_bcc: If True, send a single message with every recipient in the
+                 envelope only (Bcc, To: undisclosed-recipients), so the body is
+                 uploaded once. If False (default), send a separate message
+                 addressed to each recipient.
     
     Returns:
         Tuple of (success: bool, error_msg: Optional[str])
@@ -70,11 +459,12 @@ def send_email(
         # Step 1: Validate inputs
         logger.info(f"Preparing to send email to {len(to_emails)} recipient(s)")
         logger.info(f"Subject: {subject}")
-        if attachments:
-            attachment_names = [os.path.basename(att) for att in attachments]
-            logger.info(f"Attachments: {', '.join(attachment_names)}")
-        else:
-            logger.info("Attachments: None")
+        if logger.isEnabledFor(logging.INFO):
+            if attachments:
+                attachment_names = [os.path.basename(att) for att in attachments]
+                logger.info(f"Attachments: {', '.join(attachment_names)}")
+            else:
+                logger.info("Attachments: None")
         
         if not to_emails or len(to_emails) == 0:
             error_msg = "Email recipient list is empty"
@@ -88,134 +478,169 @@ def send_email(
                 logger.error(error_msg)
                 return False, error_msg
         
-        # Validate attachment paths if provided
+        # Validate attachment paths if provided (one stat per file, reused as the
+        # attachment cache key when the parts are built)
+        attachment_stats = {}
         if attachments:
             for attachment_path in attachments:
-                if not os.path.exists(attachment_path):
+                try:
+                    attachment_stats[attachment_path] = os.stat(attachment_path)
+                except OSError:
                     error_msg = f"Attachment file not found: {attachment_path}"
                     logger.error(error_msg)
                     return False, error_msg
-                if not os.path.isfile(attachment_path):
+                if not stat.S_ISREG(attachment_stats[attachment_path].st_mode):
                     error_msg = f"Attachment path is not a file: {attachment_path}"
                     logger.error(error_msg)
                     return False, error_msg
         
-        # Step 2: Read SMTP configuration from environment variables
-        smtp_server = os.getenv('SMTP_SERVER')
-        smtp_user = os.getenv('SMTP_USER')
-        smtp_password = os.getenv('SMTP_PASSWORD')
-        smtp_port = int(os.getenv('SMTP_PORT', DEFAULT_SMTP_PORT))
-        
-        # Validate SMTP configuration
-        if not smtp_server:
-            error_msg = "SMTP_SERVER environment variable is not set"
-            logger.error(error_msg)
-            return False, error_msg
-        
-        if not smtp_user:
-            error_msg = "SMTP_USER environment variable is not set"
+        # Step 2: Read SMTP configuration from environment variables (cached per process)
+        try:
+            smtp_config = _smtp_config()
+        except SMTPConfigError as e:
+            error_msg = str(e)
             logger.error(error_msg)
             return False, error_msg
         
-        if not smtp_password:
-            error_msg = "SMTP_PASSWORD environment variable is not set"
-            logger.error(error_msg)
-            return False, error_msg
+        logger.info(f"SMTP Configuration: {smtp_config.server}:{smtp_config.port}")
+        logger.debug(f"SMTP User: {smtp_config.user}")
         
-        logger.info(f"SMTP Configuration: {smtp_server}:{smtp_port}")
-        logger.debug(f"SMTP User: {smtp_user}")
+        # Step 3: Build the message parts once - the body and attachments are the
+        # same for every send, so only the root container and headers vary.
+        # RFC-compliant MIME structure:
+        # multipart/mixed (root, built per send)
+        # ├── multipart/alternative (body container)
+        # │   └── text/html
+        # └── application/pdf (attachment)
+
+        # Inner container for body alternatives (currently only HTML)
+        alternative_part = MIMEMultipart('alternative')
+
+        # Add HTML body (unchanged content)
+        html_part = MIMEText(html_body, 'html')
+        alternative_part.attach(html_part)
+
+        # Read and base64-encode each attachment once
+        attachment_parts = []
+        if attachments:
+            for attachment_path in attachments:
+                try:
+                    attachment_parts.append(
+                        _build_attachment_part(attachment_path, attachment_stats.get(attachment_path))
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to attach {attachment_path}: {str(e)}")
+                    # Continue even if attachment fails
         
-        # Step 3: Send email to each recipient
+        # Step 4: Send over pooled SMTP connections
+        # (connect/STARTTLS/login once per connection instead of once per recipient)
         success_count = 0
         failed_recipients = []
+        skipped_recipients = []
         
-        for i, recipient in enumerate(to_emails):
-            try:
-                logger.info(f"Sending email to {recipient} ({i+1}/{len(to_emails)})")
-                
-                # Create RFC-compliant MIME structure:
-                # multipart/mixed (root)
-                # ├── multipart/alternative (body container)
-                # │   └── text/html
-                # └── application/pdf (attachment)
-
-                # Root container for entire message (supports attachments)
-                mixed_msg = MIMEMultipart('mixed')
-                mixed_msg['From'] = smtp_user
-                mixed_msg['To'] = recipient
-                mixed_msg['Subject'] = subject
-
-                # Inner container for body alternatives (currently only HTML)
-                alternative_part = MIMEMultipart('alternative')
-
-                # Add HTML body (unchanged content)
-                html_part = MIMEText(html_body, 'html')
-                alternative_part.attach(html_part)
-
-                # Attach the body container to the root
-                mixed_msg.attach(alternative_part)
-                
-                # Add attachments if provided (attach to multipart/mixed root)
-                if attachments:
-                    for attachment_path in attachments:
-                        try:
-                            with open(attachment_path, 'rb') as f:
-                                attachment = MIMEBase('application', 'octet-stream')
-                                attachment.set_payload(f.read())
-                            
-                            encoders.encode_base64(attachment)
-                            
-                            # Get filename from path
-                            filename = os.path.basename(attachment_path)
-                            # Properly formatted Content-Disposition header
-                            # No leading spaces; filename safely quoted
-                            attachment.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename="{filename}"'
-                            )
-                            
-                            mixed_msg.attach(attachment)
-                            logger.debug(f"Attached file: {filename}")
-                        except Exception as e:
-                            logger.warning(f"Failed to attach {attachment_path}: {str(e)}")
-                            # Continue even if attachment fails
-                
-                # Connect to SMTP server and send
-                server = smtplib.SMTP(smtp_server, smtp_port)
-                server.starttls()  # Enable TLS encryption
-                server.login(smtp_user, smtp_password)
-                server.send_message(mixed_msg)
-                server.quit()
-                
-                success_count += 1
-                logger.info(f"Email sent successfully to {recipient}")
-                
-                # Add delay between emails (except for last one)
-                if i < len(to_emails) - 1:
-                    time.sleep(EMAIL_DELAY_SECONDS)
-                    logger.debug(f"Waiting {EMAIL_DELAY_SECONDS} seconds before next email")
-                
-            except Exception as e:
-                error_msg = f"Failed to send email to {recipient}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                failed_recipients.append(recipient)
-                # Continue to next recipient even if one fails
+        if use_bcc:
+            # One transaction for everyone: recipients are only in the envelope,
+            # so they do not see each other and the body is uploaded once
+            logger.info(f"Sending one email to {len(to_emails)} recipient(s) via Bcc")
+            with _SMTPConnectionPool(smtp_config, size=1) as pool:
+                try:
+                    bcc_msg = _build_root_message(
+                        smtp_config.user, "undisclosed-recipients:;", subject, alternative_part, attachment_parts
+                    )
+                    _send_rate_limiter.acquire()
+                    refused = pool.send(bcc_msg.as_bytes(policy=_SMTP_POLICY), to_emails)
+                    for recipient, (code, response) in refused.items():
+                        logger.error(f"Failed to send email to {recipient}: {code} {response!r}")
+                        failed_recipients.append(recipient)
+                    success_count = len(to_emails) - len(failed_recipients)
+                except Exception as e:
+                    logger.error(f"Failed to send Bcc email: {str(e)}", exc_info=True)
+                    failed_recipients.extend(to_emails)
+        else:
+            # Deliver recipients concurrently, one worker per pooled connection
+            pool_size = min(SMTP_POOL_SIZE, len(to_emails))
+            
+            # Early abort: once a third of a large batch has failed, skip the rest
+            abort_after_failures = len(to_emails) // 3 if len(to_emails) >= EARLY_ABORT_MIN_RECIPIENTS else None
+            failure_count = 0
+            failure_lock = threading.Lock()
+            
+            # Per-recipient lines go to DEBUG; INFO gets a progress line every ~10%
+            progress_interval = max(1, len(to_emails) // 10)
+            processed_count = 0
+            progress_lock = threading.Lock()
+            abort_event = threading.Event()
+            
+            # Serialize the message once; each recipient only adds its own To header
+            message_bytes = _build_root_message(
+                smtp_config.user, None, subject, alternative_part, attachment_parts
+            ).as_bytes(policy=_SMTP_POLICY)
+            
+            def send_to_recipient(i: int, recipient: str) -> Optional[bool]:
+                """Returns True if sent, False if failed, None if skipped after an early abort."""
+                nonlocal failure_count, processed_count
+                if abort_event.is_set():
+                    return None
+                try:
+                    logger.debug(f"Sending email to {recipient} ({i+1}/{len(to_emails)})")
+                    
+                    _send_rate_limiter.acquire()
+                    pool.send(_prepend_to_header(message_bytes, recipient), [recipient])
+                    
+                    logger.debug(f"Email sent successfully to {recipient}")
+                    return True
+                    
+                except Exception as e:
+                    error_msg = f"Failed to send email to {recipient}: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    with failure_lock:
+                        failure_count += 1
+                        if (abort_after_failures is not None and failure_count >= abort_after_failures
+                                and not abort_event.is_set()):
+                            logger.error(f"{failure_count} of {len(to_emails)} sends failed. "
+                                         f"Aborting remaining recipients.")
+                            abort_event.set()
+                    # Continue to next recipient even if one fails (unless aborted)
+                    return False
+                finally:
+                    with progress_lock:
+                        processed_count += 1
+                        if processed_count % progress_interval == 0 or processed_count == len(to_emails):
+                            logger.info(f"Processed {processed_count}/{len(to_emails)} recipient(s), "
+                                        f"{failure_count} failed")
+            
+            with _SMTPConnectionPool(smtp_config, size=pool_size) as pool:
+                with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                    results = list(executor.map(send_to_recipient, range(len(to_emails)), to_emails))
+            
+            for recipient, sent in zip(to_emails, results):
+                if sent:
+                    success_count += 1
+                elif sent is None:
+                    skipped_recipients.append(recipient)
+                else:
+                    failed_recipients.append(recipient)
         
-        # Step 4: Return result
+        # Step 5: Return result
         if success_count == 0:
             error_msg = f"Failed to send email to all {len(to_emails)} recipient(s)"
             if failed_recipients:
                 error_msg += f". Failed recipients: {', '.join(failed_recipients)}"
+            if skipped_recipients:
+                error_msg += f". Skipped recipients: {', '.join(skipped_recipients)}"
             logger.error(error_msg)
             return False, error_msg
         
-        if failed_recipients:
+        if failed_recipients or skipped_recipients:
             logger.warning(f"Email sending partially successful: {success_count} sent, "
-                         f"{len(failed_recipients)} failed")
-            logger.warning(f"Failed recipients: {', '.join(failed_recipients)}")
+                         f"{len(failed_recipients)} failed, {len(skipped_recipients)} skipped")
+            if failed_recipients:
+                logger.warning(f"Failed recipients: {', '.join(failed_recipients)}")
+            if skipped_recipients:
+                logger.warning(f"Skipped recipients (batch aborted): {', '.join(skipped_recipients)}")
         
         logger.info(f"Email sending completed: {success_count} successful, "
-                   f"{len(failed_recipients)} failed")
+                   f"{len(failed_recipients)} failed, {len(skipped_recipients)} skipped")
         return True, None
         
     except Exception as e:
@@ -10,8 +10,13 @@ No Streamlit code executes in this module.
 
 import pandas as pd
 import numpy as np
+import io
+import math
 import os
-from typing import Tuple, Optional
+import re
+import threading
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Tuple, Optional
 
 # Import safe pure function from comparison_tab
 try:
@@ -70,16 +75,59 @@ TUBES_WT = [
     "Small Wall Tube", "Medium Wall Tube", "Heavy Wall Tube", "Non-Standard Tube"
 ]
 
+# Heatmap column order per grade type (derive_grade_type_from_spec values)
+WT_ORDER_BY_GRADE_TYPE = {
+    "CS & AS": CS_AS_WT,
+    "SS": SS_WT,
+    "IS": IS_WT,
+    "Tubes": TUBES_WT,
+}
+
+# Ordered categorical dtype for the heatmap rows: grouping on it works on small
+# integer codes instead of comparing strings
+OD_CAT = pd.CategoricalDtype(OD_ORDER, ordered=True)
+
 # ============================================================================
 # Specification Mapping (copied from dashboard logic)
 # ============================================================================
 
+# Specification -> grade type workbook (relative to the working directory)
+SPECIFICATION_MAPPING_FILE = 'Spec_mapping.xlsx'
+
+def _mapping_source_stamp(mapping_file):
+    """Modification time (ns) and size of the mapping workbook, as stored in its Parquet cache"""
+    mapping_stat = os.stat(mapping_file)
+    return f"{mapping_stat.st_mtime_ns}:{mapping_stat.st_size}"
+
 def load_specification_mapping():
-    """Load specification to grade type mapping from Excel file"""
+    """Load specification to grade type mapping from Excel file (or its Parquet cache)"""
     try:
-        mapping_file = 'Spec_mapping.xlsx'
+        mapping_file = SPECIFICATION_MAPPING_FILE
+        cache_file = os.path.splitext(mapping_file)[0] + '.parquet'
         if os.path.exists(mapping_file):
-            mapping_df = pd.read_excel(mapping_file)
+            mapping_df = None
+            source_stamp = _mapping_source_stamp(mapping_file)
+            # A Parquet copy of the workbook reads much faster; use it only if it
+            # was written from this exact workbook (mtime and size stored in attrs).
+            # An mtime comparison would miss workbooks deployed with an older mtime.
+            if os.path.exists(cache_file):
+                try:
+                    cached_df = pd.read_parquet(cache_file)
+                    if cached_df.attrs.get('source_stamp') == source_stamp:
+                        mapping_df = cached_df
+                except Exception as e:
+                    logger.warning(f"Could not read specification mapping cache {cache_file}: {e}")
+            if mapping_df is None:
+                mapping_df = pd.read_excel(mapping_file)
+                try:
+                    cache_df = mapping_df[['Specification', 'Grade Type']].copy()
+                    cache_df.attrs['source_stamp'] = source_stamp
+                    # Write to a temp file and swap it in, so readers never see a partial file
+                    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+                    cache_df.to_parquet(temp_file, index=False)
+                    os.replace(temp_file, cache_file)
+                except Exception as e:
+                    logger.warning(f"Could not write specification mapping cache {cache_file}: {e}")
             spec_to_grade = dict(zip(mapping_df['Specification'], mapping_df['Grade Type']))
             return spec_to_grade
         else:
@@ -89,17 +137,61 @@ def load_specification_mapping():
         logger.warning(f"Error loading specification mapping: {e}. Using fallback logic.")
         return {}
 
-# Load mapping once at module level
-SPECIFICATION_MAPPING = load_specification_mapping()
+# Loaded once per process. The lock makes concurrent first callers (the
+# per-sheet preprocessing threads) wait for one load instead of each reading
+# the workbook and writing its cache.
+_SPEC_MAPPING = None
+_SPEC_MAPPING_LOCK = threading.Lock()
+
+def get_specification_mapping():
+    """Specification mapping, loaded on first use (not at import) and cached for the process"""
+    global _SPEC_MAPPING
+    mapping = _SPEC_MAPPING
+    if mapping is None:
+        with _SPEC_MAPPING_LOCK:
+            if _SPEC_MAPPING is None:
+                _SPEC_MAPPING = load_specification_mapping()
+            mapping = _SPEC_MAPPING
+    return mapping
+
+def __getattr__(name):
+    # Keep the former module-level SPECIFICATION_MAPPING attribute working, lazily
+    if name == "SPECIFICATION_MAPPING":
+        return get_specification_mapping()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================================================
 # Grade Derivation Functions (copied from dashboard)
 # ============================================================================
 
+# Pattern-based fallback as one anchored regex. Alternatives are tried in the
+# same order as the original checks, so the first one that matches wins:
+# "IS" after the first character, a tube marker in a spec not starting with "T",
+# then the AS/CS/SS/IS/T prefixes.
+_GRADE_PATTERN_RE = re.compile(
+    r'^(?:(?P<IS_MID>(?!IS).*?IS)'
+    r'|(?P<TUBE_MID>(?!T).*?(?:TUB|ST52|ST42))'
+    r'|(?P<AS>AS)|(?P<CS>CS)|(?P<SS>SS)|(?P<IS>IS)|(?P<T>T))',
+    re.DOTALL
+)
+_GRADE_PATTERN_GRADES = {
+    'IS_MID': 'IS', 'TUBE_MID': 'Tubes',
+    'AS': 'AS', 'CS': 'CS', 'SS': 'SS', 'IS': 'IS', 'T': 'Tubes',
+}
+
+def _derive_grade_from_pattern(spec_upper):
+    """Grade for an upper-cased specification that is not in the mapping file"""
+    match = _GRADE_PATTERN_RE.match(spec_upper)
+    return _GRADE_PATTERN_GRADES[match.lastgroup] if match else "Unknown"
+
+@lru_cache(maxsize=8192)
 def derive_grade_from_spec(spec, combine_cs_as=False):
     """
     Consolidated function to derive Grade Type from Specification.
     Copied from dashboard - exact same logic.
+    
+    Cached like the dashboard version: the Stock, Reservations and Incoming
+    sheets share most specifications, so each one is derived once per run.
     """
     if pd.isna(spec):
         return "Unknown"
@@ -107,8 +199,9 @@ def derive_grade_from_spec(spec, combine_cs_as=False):
     spec_str = str(spec).strip()
     
     # First try to get from mapping
-    if spec_str in SPECIFICATION_MAPPING:
-        grade_type = SPECIFICATION_MAPPING[spec_str]
+    specification_mapping = get_specification_mapping()
+    if spec_str in specification_mapping:
+        grade_type = specification_mapping[spec_str]
         if combine_cs_as and grade_type in ["AS", "CS"]:
             return "CS & AS"
         elif combine_cs_as and grade_type == "TUBES":
@@ -117,32 +210,44 @@ def derive_grade_from_spec(spec, combine_cs_as=False):
             return grade_type
     
     # Fallback to pattern-based derivation
-    spec_upper = spec_str.upper()
+    grade_type = _derive_grade_from_pattern(spec_str.upper())
+    if combine_cs_as and grade_type in ("AS", "CS"):
+        return "CS & AS"
+    return grade_type
+
+def derive_grades_from_specs(specs, combine_cs_as=False):
+    """
+    Vectorized derive_grade_from_spec over a sequence of specifications.
     
-    # Check for IS specifications (contains IS in middle, like: CSEWPIS1239PT1)
-    if "IS" in spec_upper and not spec_upper.startswith("IS"):
-        return "IS"
+    Args:
+        specs: Specification values (Series, array or list)
+        combine_cs_as: Combine AS and CS grades into "CS & AS"
     
-    # Check for Tube specifications (contains T in middle, like: CSSMT2391ST52)
-    if "T" in spec_upper and not spec_upper.startswith("T"):
-        # More specific check for tube patterns
-        if any(pattern in spec_upper for pattern in ["TUBE", "TUB", "ST52", "ST42"]):
-            return "Tubes"
+    Returns:
+        Object ndarray of grade types, aligned with specs
+    """
+    specs = pd.Series(specs, dtype=object).reset_index(drop=True)
+    spec_strs = specs.astype(str).str.strip()
+    grades = pd.Series("Unknown", index=specs.index, dtype=object)
+    
+    # First try to get from mapping
+    specification_mapping = get_specification_mapping()
+    in_mapping = spec_strs.isin(specification_mapping.keys()) & specs.notna()
+    mapped = spec_strs[in_mapping].map(specification_mapping)
+    if combine_cs_as:
+        mapped = mapped.replace({"AS": "CS & AS", "CS": "CS & AS", "TUBES": "Tubes"})
+    grades[in_mapping] = mapped
+    
+    # Fallback to pattern-based derivation: one regex scan per specification
+    fallback = ~in_mapping & specs.notna()
+    if fallback.any():
+        matched = spec_strs[fallback].str.upper().str.extract(_GRADE_PATTERN_RE).notna()
+        pattern_grades = matched.idxmax(axis=1).map(_GRADE_PATTERN_GRADES).where(matched.any(axis=1), "Unknown")
+        if combine_cs_as:
+            pattern_grades = pattern_grades.replace({"AS": "CS & AS", "CS": "CS & AS"})
+        grades[fallback] = pattern_grades
     
-    # Check starting patterns
-    if spec_upper.startswith("AS"):
-        return "CS & AS" if combine_cs_as else "AS"
-    elif spec_upper.startswith("CS"):
-        return "CS & AS" if combine_cs_as else "CS"
-    elif spec_upper.startswith("SS"):
-        return "SS"
-    elif spec_upper.startswith("IS"):
-        return "IS"
-    elif spec_upper.startswith("T"):
-        return "Tubes"
-    
-    # Default fallback
-    return "Unknown"
+    return grades.to_numpy(dtype=object)
 
 def derive_grade_type_from_spec(specification):
     """Derive Grade Type from Specification name using mapping or fallback logic"""
@@ -152,23 +257,73 @@ def derive_grade_type_from_spec(specification):
 # OD Categorization Functions (copied from dashboard)
 # ============================================================================
 
+# OD lookup tables (exact OD in mm -> nominal size), shared by the scalar and
+# vectorized categorizers
+OD_MAP_CS_AS = {
+    10.3: '1/8"', 13.7: '1/4"', 17.1: '3/8"', 21.3: '1/2"', 26.7: '3/4"', 33.4: '1"',
+    42.2: '1-1/4"', 48.3: '1-1/2"', 60.3: '2"', 73.0: '2-1/2"', 88.9: '3"', 101.6: '3-1/2"',
+    114.3: '4"', 141.3: '5"', 168.3: '6"', 219.1: '8"', 273.0: '10"', 273.1: '10"',
+    323.8: '12"', 355.6: '14"', 406.4: '16"', 457.0: '18"', 457.2: '18"', 508.0: '20"',
+    559.0: '22"', 609.6: '24"', 610.0: '24"', 660.0: '26"', 660.4: '26"', 711.0: '28"',
+    711.2: '28"', 762.0: '30"', 813.0: '32"', 812.8: '32"', 864.0: '34"', 863.6: '34"',
+    914.0: '36"', 914.4: '36"', 965.0: '38"', 965.2: '38"', 1016.0: '40"', 1066.0: '42"',
+    1066.8: '42"', 1067.0: '42"', 1118.0: '44"', 1117.6: '44"', 1168.0: '46"', 1168.4: '46"',
+    1219.0: '48"', 1219.2: '48"', 1321.0: '52"', 1422.0: '56"', 1524.0: '60"', 1626.0: '64"',
+    1727.0: '68"', 1829.0: '72"', 1930.0: '76"', 2032.0: '80"'
+}
+
+OD_MAP_IS = {
+    10.32: '1/8"', 13.49: '1/4"', 17.10: '3/8"', 21.30: '1/2"', 21.43: '1/2"',
+    26.90: '3/4"', 27.20: '3/4"', 33.70: '1"', 33.80: '1"', 42.90: '1-1/4"',
+    48.40: '1-1/2"', 48.30: '1-1/2"', 60.30: '2"', 76.10: '2-1/2"', 76.20: '2-1/2"',
+    88.90: '3"', 114.30: '4"', 139.70: '5"', 165.10: '6"'
+}
+
+OD_MAP_TUBE = {
+    6.35: '1/4"', 9.53: '3/8"', 12.70: '1/2"', 15.88: '5/8"', 19.05: '3/4"',
+    22.23: '7/8"', 25.40: '1"', 31.75: '1-1/4"', 38.10: '1-1/2"', 50.80: '2"',
+    63.50: '2-1/2"', 76.20: '3"', 101.60: '4"'
+}
+
+# Integer-keyed views of the OD tables: OD quantized to thousandths of a mm, the
+# precision the preprocessor rounds OD to. Integer keys hash faster than floats
+# and avoid float-equality surprises in lookups.
+OD_KEY_SCALE = 1000
+
+
+def _od_key_table(od_map: dict) -> dict:
+    """Re-key an OD table by quantized integer OD."""
+    return {round(od * OD_KEY_SCALE): label for od, label in od_map.items()}
+
+
+OD_MAP_CS_AS_KEYED = _od_key_table(OD_MAP_CS_AS)
+OD_MAP_IS_KEYED = _od_key_table(OD_MAP_IS)
+OD_MAP_TUBE_KEYED = _od_key_table(OD_MAP_TUBE)
+
+# Combined table for categorize_OD_vectorized: every (OD key, table) pair as one
+# sorted int64 key, so a whole column is resolved with a single searchsorted.
+# Table codes: 0 = CS/AS/SS, 1 = IS, 2 = Tube.
+_OD_TABLES = (OD_MAP_CS_AS_KEYED, OD_MAP_IS_KEYED, OD_MAP_TUBE_KEYED)
+_OD_TABLE_DEFAULTS = np.array(["Non Standard OD", "Non Standard OD", "Unknown OD", "Unknown Grade"], dtype=object)
+
+def _od_lookup_arrays() -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted combined keys (od_key * table count + table code) and their labels."""
+    keys = []
+    labels = []
+    for table_code, table in enumerate(_OD_TABLES):
+        for od_key, label in table.items():
+            keys.append(od_key * len(_OD_TABLES) + table_code)
+            labels.append(label)
+    order = np.argsort(keys)
+    return np.array(keys, dtype=np.int64)[order], np.array(labels, dtype=object)[order]
+
+
+_OD_LOOKUP_KEYS, _OD_LOOKUP_LABELS = _od_lookup_arrays()
+
 def categorize_OD_CS_AS(od):
     """Categorize OD for CS/AS grade types"""
-    od_map = {
-        10.3: '1/8"', 13.7: '1/4"', 17.1: '3/8"', 21.3: '1/2"', 26.7: '3/4"', 33.4: '1"',
-        42.2: '1-1/4"', 48.3: '1-1/2"', 60.3: '2"', 73.0: '2-1/2"', 88.9: '3"', 101.6: '3-1/2"',
-        114.3: '4"', 141.3: '5"', 168.3: '6"', 219.1: '8"', 273.0: '10"', 273.1: '10"',
-        323.8: '12"', 355.6: '14"', 406.4: '16"', 457.0: '18"', 457.2: '18"', 508.0: '20"',
-        559.0: '22"', 609.6: '24"', 610.0: '24"', 660.0: '26"', 660.4: '26"', 711.0: '28"',
-        711.2: '28"', 762.0: '30"', 813.0: '32"', 812.8: '32"', 864.0: '34"', 863.6: '34"',
-        914.0: '36"', 914.4: '36"', 965.0: '38"', 965.2: '38"', 1016.0: '40"', 1066.0: '42"',
-        1066.8: '42"', 1067.0: '42"', 1118.0: '44"', 1117.6: '44"', 1168.0: '46"', 1168.4: '46"',
-        1219.0: '48"', 1219.2: '48"', 1321.0: '52"', 1422.0: '56"', 1524.0: '60"', 1626.0: '64"',
-        1727.0: '68"', 1829.0: '72"', 1930.0: '76"', 2032.0: '80"'
-    }
     try:
-        od = float(od)
-        return od_map.get(od, "Non Standard OD")
+        return OD_MAP_CS_AS_KEYED.get(round(float(od) * OD_KEY_SCALE), "Non Standard OD")
     except:
         return "Non Standard OD"
 
@@ -178,28 +333,15 @@ def categorize_OD_SS(od):
 
 def categorize_OD_IS(od):
     """Categorize OD for IS grade types"""
-    od_map = {
-        10.32: '1/8"', 13.49: '1/4"', 17.10: '3/8"', 21.30: '1/2"', 21.43: '1/2"',
-        26.90: '3/4"', 27.20: '3/4"', 33.70: '1"', 33.80: '1"', 42.90: '1-1/4"',
-        48.40: '1-1/2"', 48.30: '1-1/2"', 60.30: '2"', 76.10: '2-1/2"', 76.20: '2-1/2"',
-        88.90: '3"', 114.30: '4"', 139.70: '5"', 165.10: '6"'
-    }
     try:
-        od = float(od)
-        return od_map.get(od, "Non Standard OD")
+        return OD_MAP_IS_KEYED.get(round(float(od) * OD_KEY_SCALE), "Non Standard OD")
     except:
         return "Non Standard OD"
 
 def categorize_OD_Tube(od):
     """Categorize OD for Tube grade types"""
-    od_map = {
-        6.35: '1/4"', 9.53: '3/8"', 12.70: '1/2"', 15.88: '5/8"', 19.05: '3/4"',
-        22.23: '7/8"', 25.40: '1"', 31.75: '1-1/4"', 38.10: '1-1/2"', 50.80: '2"',
-        63.50: '2-1/2"', 76.20: '3"', 101.60: '4"'
-    }
     try:
-        od = float(od)
-        return od_map.get(od, "Unknown OD")
+        return OD_MAP_TUBE_KEYED.get(round(float(od) * OD_KEY_SCALE), "Unknown OD")
     except:
         return "Unknown OD"
 
@@ -207,30 +349,77 @@ def categorize_OD(od, grade):
     """Main OD categorization function"""
     if pd.isna(grade):
         return "Unknown Grade"
+    table_code = _od_table_code(grade)
+    try:
+        return _categorize_OD_cached(od, table_code)
+    except TypeError:
+        # Unhashable OD value - categorize without the cache
+        return _OD_CATEGORIZERS[table_code](od)
+
+@lru_cache(maxsize=256)
+def _od_table_code(grade) -> int:
+    """OD table code (see _OD_TABLES) for a non-missing grade, as categorize_OD picks it (SS uses the CS/AS table)."""
     grade_clean = str(grade).strip().lower()
     if "is" in grade_clean:
-        return categorize_OD_IS(od)
-    elif "tube" in grade_clean:
-        return categorize_OD_Tube(od)
-    elif "ss" in grade_clean or "stainless" in grade_clean:
-        return categorize_OD_SS(od)
-    else:
-        return categorize_OD_CS_AS(od)
+        return 1
+    if "tube" in grade_clean:
+        return 2
+    return 0
+
+# OD categorizer per table code
+_OD_CATEGORIZERS = (categorize_OD_CS_AS, categorize_OD_IS, categorize_OD_Tube)
+
+@lru_cache(maxsize=8192)
+def _categorize_OD_cached(od, table_code: int) -> str:
+    """categorize_OD for an OD and table code, memoized across repeated inventory rows."""
+    return _OD_CATEGORIZERS[table_code](od)
+
+def categorize_OD_vectorized(od_series: pd.Series, grade_series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of categorize_OD() over whole columns.
+    
+    Picks the OD table once per distinct grade (same precedence as categorize_OD),
+    then resolves every row with one binary search over the combined integer
+    key table instead of a Python call per row.
+    
+    Args:
+        od_series: OD values (numeric or numeric strings)
+        grade_series: Grade values aligned with od_series
+    
+    Returns:
+        Series of OD category labels with the same index as od_series
+    """
+    od_keys = np.round(
+        pd.to_numeric(od_series, errors='coerce').to_numpy(dtype=float, na_value=np.nan) * OD_KEY_SCALE
+    )
+    valid_od = np.isfinite(od_keys) & (np.abs(od_keys) < 2 ** 53)
+    od_keys = np.where(valid_od, od_keys, 0).astype(np.int64)
+    
+    # Table code per row; missing grades get -1, which picks "Unknown Grade"
+    grade_codes, unique_grades = pd.factorize(grade_series)
+    table_codes = np.array([_od_table_code(grade) for grade in unique_grades] + [-1], dtype=np.int64)[grade_codes]
+    
+    lookup_keys = od_keys * len(_OD_TABLES) + table_codes
+    positions = np.searchsorted(_OD_LOOKUP_KEYS, lookup_keys).clip(max=len(_OD_LOOKUP_KEYS) - 1)
+    found = valid_od & (table_codes >= 0) & (_OD_LOOKUP_KEYS[positions] == lookup_keys)
+    
+    categories = _OD_TABLE_DEFAULTS[table_codes]
+    categories[found] = _OD_LOOKUP_LABELS[positions[found]]
+    return pd.Series(categories, index=od_series.index, dtype=object)
 
 # ============================================================================
 # WT Schedule Categorization Functions (copied from dashboard)
 # ============================================================================
 
-def categorize_carbon(od, wt):
-    """Categorize WT schedule for Carbon/CS/AS grade types"""
-    try:
-        od = float(od)
-        wt = float(wt)
-    except:
-        return "Non STD"
-    
+# WT schedule tables: (schedule, [(defined_od, defined_wt), ...]) in match order.
+# An OD/WT pair gets the first schedule with an entry within WT_OD_TOLERANCE
+# of the OD and WT_WT_TOLERANCE of the WT.
+WT_OD_TOLERANCE = 1.0
+WT_WT_TOLERANCE = 0.2
+
+CARBON_WT_SCHEDULES = [
     # STD (Standard Weight) - Same as SCH 40 for NPS 1/8" to NPS 10"
-    for defined_od, defined_wt in [
+    ("STD", [
         (10.3, 1.73), (13.7, 2.24), (17.1, 2.31), (21.3, 2.77), (26.7, 2.87), (33.4, 3.38),
         (42.2, 3.56), (48.3, 3.68), (60.3, 3.91), (73.0, 5.16), (88.9, 5.49), (101.6, 5.74),
         (114.3, 6.02), (141.3, 6.55), (168.3, 7.11), (219.1, 8.18), (273.0, 9.27), (273.1, 9.27),
@@ -239,12 +428,9 @@ def categorize_carbon(od, wt):
         (711, 9.53), (762, 9.53), (812.8, 9.53), (863.6, 9.53), (914.4, 9.53), (914, 9.53),
         (965.2, 9.53), (1016, 9.53), (1066.8, 9.53), (1117.6, 9.53), (1168.4, 9.53), (1219.2, 9.53),
         (1219, 12.70), (1524, 12.70)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "STD"
-    
+    ]),
     # XS (Extra Strong) - Same as SCH 80 for NPS 1/8" to NPS 8"
-    for defined_od, defined_wt in [
+    ("XS", [
         (10.3, 2.41), (13.7, 3.02), (17.1, 3.20), (21.3, 3.73), (26.7, 3.91), (33.4, 4.55),
         (42.2, 4.85), (48.3, 5.08), (60.3, 5.54), (73.0, 7.01), (88.9, 7.62), (101.6, 8.08),
         (114.3, 8.56), (141.3, 9.53), (168.3, 10.97), (219.1, 12.70), (273.0, 12.70), (273.1, 12.70),
@@ -252,223 +438,279 @@ def categorize_carbon(od, wt):
         (610.0, 12.70), (609.6, 12.70), (660.4, 12.70), (711.2, 12.70), (762, 12.70), (812.8, 12.70),
         (863.6, 12.70), (914.4, 12.70), (914, 12.70), (965.2, 12.70), (1016, 12.70), (1066.8, 12.70),
         (1117.6, 12.70), (1168.4, 12.70), (1219.2, 12.70), (1219, 12.70), (1524, 12.70)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "XS"
-    
+    ]),
     # XXS (Double Extra Strong)
-    for defined_od, defined_wt in [
+    ("SCH XXS", [
         (10.3, 4.83), (13.7, 6.05), (17.1, 6.40), (21.3, 7.47), (26.7, 7.82), (33.4, 9.09),
         (42.2, 9.70), (48.3, 10.15), (60.3, 11.07), (73.0, 14.02), (88.9, 15.24), (114.3, 17.12),
         (141.3, 19.05), (168.3, 21.95), (219.1, 22.23), (273.0, 25.40), (273.1, 25.40), (323.8, 25.40)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH XXS"
-    
+    ]),
     # SCH 10
-    for defined_od, defined_wt in [
+    ("SCH 10", [
         (10.3, 1.24), (13.7, 1.65), (17.1, 1.65), (21.3, 2.11), (26.7, 2.11), (33.4, 2.77),
         (42.2, 2.77), (48.3, 2.77), (60.3, 2.77), (73.0, 3.05), (88.9, 3.05), (101.6, 3.05),
         (114.3, 3.05), (141.3, 3.40), (168.3, 3.40), (219.1, 3.76), (273.0, 4.19), (273.1, 4.19),
         (323.8, 4.57), (355.6, 6.35), (406.4, 6.35), (457.0, 6.35), (508.0, 6.35), (559.0, 6.35),
         (610.0, 6.35), (609.6, 6.35)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 10"
-    
+    ]),
     # SCH 20
-    for defined_od, defined_wt in [
+    ("SCH 20", [
         (219.1, 6.35), (273.0, 6.35), (273.1, 6.35), (323.8, 6.35), (323.8, 7.1),
         (355.6, 7.92), (406.4, 7.92), (457.0, 7.92), (508.0, 9.53), (559.0, 9.53),
         (610.0, 9.53), (609.6, 9.53)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 20"
-    
+    ]),
     # SCH 30
-    for defined_od, defined_wt in [
+    ("SCH 30", [
         (21.3, 2.41), (26.7, 2.41), (33.4, 2.90), (42.2, 2.97), (48.3, 3.18), (60.3, 3.18),
         (73.0, 4.78), (88.9, 4.78), (101.6, 4.78), (114.3, 4.78), (219.1, 7.04), (273.0, 7.80),
         (273.1, 7.80), (323.8, 8.38), (355.6, 9.53), (406.4, 9.53), (457.0, 11.13), (508.0, 12.70),
         (559.0, 12.70), (610.0, 14.27), (609.6, 14.27)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 30"
-    
+    ]),
     # SCH 40 - Same as STD for NPS 1/8" to NPS 10"
-    for defined_od, defined_wt in [
+    ("SCH 40", [
         (10.3, 1.73), (13.7, 2.24), (17.1, 2.31), (21.3, 2.77), (26.7, 2.87), (33.4, 3.38),
         (42.2, 3.56), (48.3, 3.68), (60.3, 3.91), (73.0, 5.16), (88.9, 5.49), (101.6, 5.74),
         (114.3, 6.02), (141.3, 6.55), (168.3, 7.11), (219.1, 8.18), (273.0, 9.27), (273.1, 9.27),
         (323.8, 10.31), (355.6, 11.13), (355.6, 14.3), (406.4, 12.70), (457.0, 14.27), (508.0, 15.09),
         (610.0, 17.48), (609.6, 17.48)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 40"
-    
+    ]),
     # SCH 60
-    for defined_od, defined_wt in [
+    ("SCH 60", [
         (219.1, 10.31), (273.0, 12.70), (273.1, 12.70), (323.8, 14.27), (355.6, 15.09),
         (406.4, 16.66), (457.0, 19.05), (457.0, 22.23), (508.0, 20.62), (559.0, 22.23),
         (610.0, 24.61), (609.6, 24.61)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 60"
-    
+    ]),
     # SCH 80 - Same as XS for NPS 1/8" to NPS 8"
-    for defined_od, defined_wt in [
+    ("SCH 80", [
         (10.3, 2.41), (13.7, 3.02), (17.1, 3.20), (21.3, 3.73), (26.7, 3.91), (33.4, 4.55),
         (42.2, 4.85), (48.3, 5.08), (60.3, 5.54), (73.0, 7.01), (88.9, 7.62), (101.6, 8.08),
         (114.3, 8.56), (141.3, 9.53), (168.3, 10.97), (219.1, 12.70), (273.0, 15.09), (273.1, 15.09),
         (323.8, 17.48), (355.6, 19.05), (406.4, 21.44), (457.0, 23.83), (508.0, 26.19),
         (559.0, 28.58), (610.0, 30.96), (609.6, 30.96)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 80"
-    
+    ]),
     # SCH 100
-    for defined_od, defined_wt in [
+    ("SCH 100", [
         (219.1, 15.09), (273.0, 18.26), (273.1, 18.26), (323.8, 21.44), (355.6, 23.83),
         (406.4, 26.19), (457.0, 29.36), (508.0, 32.54), (559.0, 34.93), (610.0, 38.89), (609.6, 38.89)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 100"
-    
+    ]),
     # SCH 120
-    for defined_od, defined_wt in [
+    ("SCH 120", [
         (114.3, 11.13), (141.3, 12.70), (168.3, 14.27), (219.1, 18.26), (273.0, 21.44),
         (273.1, 21.44), (323.8, 25.40), (355.6, 27.79), (406.4, 30.96), (457.0, 34.93),
         (508.0, 38.10), (559.0, 41.28), (610.0, 46.02), (609.6, 46.02)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 120"
-    
+    ]),
     # SCH 140
-    for defined_od, defined_wt in [
+    ("SCH 140", [
         (219.1, 20.62), (273.0, 25.40), (273.1, 25.40), (323.8, 28.58), (355.6, 31.75),
         (406.4, 36.53), (457.0, 39.67), (508.0, 44.45), (559.0, 47.63), (610.0, 52.37), (609.6, 52.37)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 140"
-    
+    ]),
     # SCH 160
-    for defined_od, defined_wt in [
+    ("SCH 160", [
         (21.3, 4.78), (26.7, 5.56), (33.4, 6.35), (42.2, 6.35), (48.3, 7.14), (60.3, 8.74),
         (73.0, 9.53), (88.9, 11.13), (114.3, 13.49), (141.3, 15.88), (168.3, 18.26), (219.1, 23.01),
         (273.0, 28.58), (273.1, 28.58), (273.1, 32), (323.8, 33.32), (355.6, 35.71), (406.4, 40.49),
         (457.0, 45.24), (508.0, 50.01), (559.0, 53.98), (610.0, 59.54), (609.6, 59.54)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH 160"
-    
-    return "Non STD"
+    ]),
+]
 
-def categorize_stainless(od, wt):
-    """Categorize WT schedule for Stainless Steel grade types"""
-    try:
-        od = float(od)
-        wt = float(wt)
-    except:
-        return "Non STD"
-    
+STAINLESS_WT_SCHEDULES = [
     # Schedule 5S
-    for defined_od, defined_wt in [
+    ("Schedule 5S", [
         (10.3, 1.24), (13.7, 1.65), (17.1, 1.65), (21.3, 1.65), (26.7, 1.65), (33.4, 2.11),
         (42.2, 2.11), (48.3, 2.11), (60.3, 2.77), (73.0, 2.77), (88.9, 2.77), (114.3, 2.77),
         (141.3, 3.40), (168.3, 3.40), (219.1, 3.76), (273.0, 4.19), (323.8, 4.57), (355.6, 4.78),
         (406.4, 4.78), (457.0, 4.78), (508.0, 5.54), (610.0, 6.35), (609.6, 6.35)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "Schedule 5S"
-    
+    ]),
     # Schedule 10S
-    for defined_od, defined_wt in [
+    ("Schedule 10S", [
         (10.3, 1.24), (13.7, 1.65), (17.1, 1.65), (21.3, 2.11), (26.7, 2.11), (33.4, 2.77),
         (42.2, 2.77), (48.3, 2.77), (60.3, 2.77), (73.0, 3.05), (88.9, 3.05), (114.3, 3.05),
         (141.3, 3.40), (168.3, 3.40), (219.1, 3.76), (273.0, 4.19), (323.8, 4.57), (355.6, 4.78),
         (406.4, 4.78), (457.0, 4.78), (508.0, 5.54), (610.0, 6.35), (609.6, 6.35)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "Schedule 10S"
-    
+    ]),
     # Schedule 40S
-    for defined_od, defined_wt in [
+    ("Schedule 40S", [
         (10.3, 1.73), (13.7, 2.24), (17.1, 2.31), (21.3, 2.77), (26.7, 2.87), (33.4, 3.38),
         (42.2, 3.56), (48.3, 3.68), (60.3, 3.91), (73.0, 5.16), (88.9, 5.49), (101.6, 5.74),
         (114.3, 6.02), (141.3, 6.55), (168.3, 7.11), (219.1, 8.18), (273.0, 9.27), (323.8, 9.53),
         (355.6, 9.53), (406.4, 9.53), (457.0, 9.53), (508.0, 9.53), (610.0, 9.53), (609.6, 9.53)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "Schedule 40S"
-    
+    ]),
     # Schedule 80S
-    for defined_od, defined_wt in [
+    ("Schedule 80S", [
         (10.3, 2.41), (13.7, 3.02), (17.1, 3.20), (21.3, 3.73), (26.7, 3.91), (33.4, 4.55),
         (42.2, 4.85), (48.3, 5.08), (60.3, 5.54), (73.0, 7.01), (88.9, 7.62), (101.6, 8.08),
         (114.3, 8.56), (141.3, 9.53), (168.3, 10.97), (219.1, 12.70), (273.0, 15.09), (273.1, 15.09),
         (323.8, 17.48), (355.6, 19.05), (406.4, 21.44), (406.4, 25.4), (457.0, 23.83), (508.0, 26.19),
         (559.0, 28.58), (610.0, 30.96), (609.6, 30.96)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "Schedule 80S"
-    
+    ]),
     # Schedule 160S
-    for defined_od, defined_wt in [
+    ("Schedule 160S", [
         (21.3, 4.78), (26.7, 5.56), (33.4, 6.35), (42.2, 6.35), (48.3, 7.14), (60.3, 8.74),
         (73.0, 9.53), (88.9, 11.13), (114.3, 13.49), (141.3, 15.88), (168.3, 18.26), (219.1, 23.01),
         (273.0, 28.58), (323.8, 33.32), (355.6, 35.71), (406.4, 40.49), (457.0, 45.24), (508.0, 50.01),
         (559.0, 53.98), (610.0, 59.54), (609.6, 59.54)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "Schedule 160S"
-    
+    ]),
     # XXS (Double Extra Strong)
-    for defined_od, defined_wt in [
+    ("SCH XXS", [
         (10.3, 4.83), (13.7, 6.05), (17.1, 6.40), (21.3, 7.47), (26.7, 7.82), (33.4, 9.09),
         (42.2, 9.70), (48.3, 10.15), (60.3, 11.07), (73.0, 14.02), (88.9, 15.24), (114.3, 17.12),
         (141.3, 19.05), (168.3, 21.95), (219.1, 22.23), (273.0, 25.40), (323.8, 25.40)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "SCH XXS"
-    
-    return "Non STD"
+    ]),
+]
 
-def categorize_is(od, wt):
-    """Categorize WT schedule for IS grade types"""
-    try:
-        od = float(od)
-        wt = float(wt)
-    except:
-        return "Non IS Standard"
-    
+IS_WT_SCHEDULES = [
     # Light (A-Class)
-    for defined_od, defined_wt in [
+    ("IS 1239: Light (A-Class)", [
         (10.32, 1.80), (13.49, 1.80), (17.10, 1.80), (21.3, 2.00), (21.43, 2.00), (27.20, 2.35),
         (33.70, 2.65), (33.80, 2.65), (42.90, 2.65), (48.40, 2.90), (48.30, 2.90), (60.30, 2.90),
         (76.20, 3.25), (88.90, 3.25), (114.30, 3.65)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "IS 1239: Light (A-Class)"
-    
+    ]),
     # Medium (B-Class)
-    for defined_od, defined_wt in [
+    ("IS 1239: Medium (B-Class)", [
         (10.32, 2.00), (13.49, 2.35), (17.10, 2.35), (21.3, 2.65), (21.43, 2.65), (27.20, 2.65),
         (33.80, 3.25), (33.70, 3.25), (42.90, 3.25), (48.40, 3.25), (48.30, 3.25), (60.30, 3.65),
         (76.20, 3.65), (76.10, 3.60), (88.90, 4.05), (114.30, 4.50), (139.70, 4.85), (165.10, 4.85)
-    ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "IS 1239: Medium (B-Class)"
-    
+    ]),
     # Heavy (C-Class)
-    for defined_od, defined_wt in [
+    ("IS 1239: Heavy (C-Class)", [
         (10.32, 2.65), (13.49, 2.90), (17.10, 2.90), (21.43, 3.25), (27.20, 3.25), (33.80, 4.05),
         (33.70, 4), (21.3, 3.2), (42.90, 4.05), (48.40, 4.05), (48.30, 4.05), (60.30, 4.47),
         (76.20, 4.47), (76.10, 4.50), (88.90, 4.85), (114.30, 5.40), (139.70, 5.40), (165.10, 5.40)
+    ]),
+]
+
+# Tube WT tables: exact (OD, WT) pairs (no tolerance), checked in this order
+
+# Light wall tubes
+TUBE_SMALL_WALL = frozenset({
+    (6.35, 0.71), (6.35, 0.89), (9.53, 0.89), (9.53, 1.24), (12.70, 0.89), (12.70, 1.24),
+    (15.88, 0.89), (15.88, 1.24), (15.88, 1.65), (19.05, 0.89), (19.05, 1.24), (19.05, 1.65),
+    (22.23, 1.24), (22.23, 1.65), (25.40, 1.24), (25.40, 1.65), (31.75, 1.24), (31.75, 1.65),
+    (31.75, 2.11), (38.10, 1.65), (38.10, 2.11), (50.80, 1.65), (50.80, 2.11), (50.80, 2.77),
+    (63.50, 1.65), (63.50, 2.11), (63.50, 2.77), (76.20, 1.65), (76.20, 2.11), (76.20, 2.77),
+    (101.60, 2.11), (101.60, 2.77)
+})
+
+# Medium wall tubes
+TUBE_MEDIUM_WALL = frozenset({
+    (6.35, 1.24), (9.53, 1.65), (12.70, 1.65), (15.88, 2.11), (19.05, 2.11), (22.23, 2.11),
+    (25.40, 2.11), (31.75, 2.77), (38.10, 2.77), (50.80, 3.05), (63.50, 3.05), (76.20, 3.05),
+    (101.60, 3.05)
+})
+
+# Heavy wall tubes
+TUBE_HEAVY_WALL = frozenset({
+    (6.35, 1.65), (9.53, 2.11), (12.70, 2.11), (15.88, 2.77), (19.05, 2.77), (22.23, 2.77),
+    (25.40, 2.77), (31.75, 3.05), (38.10, 3.05), (50.80, 3.40), (63.50, 3.40), (76.20, 3.40),
+    (101.60, 3.40)
+})
+
+# Extra heavy wall tubes
+TUBE_EXTRA_HEAVY_WALL = frozenset({
+    (15.88, 3.05), (19.05, 3.05), (22.23, 3.05), (25.40, 3.05), (31.75, 3.40), (38.10, 3.40),
+    (50.80, 3.73), (63.50, 3.73), (76.20, 3.73), (101.60, 4.78)
+})
+
+def _tube_label_table() -> dict:
+    """Tube label per exact (OD, WT) pair; the first table listing a pair wins, as in categorize_WT_Tube."""
+    labels = {}
+    for pairs, label in [
+        (TUBE_SMALL_WALL, "Small Wall Tube"),
+        (TUBE_MEDIUM_WALL, "Medium Wall Tube"),
+        (TUBE_HEAVY_WALL, "Heavy Wall Tube"),
+        (TUBE_EXTRA_HEAVY_WALL, "Non-Standard Tube"),
     ]:
-        if abs(od - defined_od) <= 1.0 and abs(wt - defined_wt) <= 0.2:
-            return "IS 1239: Heavy (C-Class)"
+        for pair in pairs:
+            labels.setdefault(pair, label)
+    return labels
+
+
+TUBE_WT_LABELS = _tube_label_table()
+
+# Scale of the WT bucket grid (buckets are 1 mm of OD by 0.1 mm of WT)
+WT_BUCKET_SCALE = 10
+
+def _reachable_wt_entries(schedules):
+    """
+    Yield (schedule index, schedule, defined_od, defined_wt) in match order,
+    skipping entries that repeat an earlier (OD, WT) pair.
+    
+    A repeated pair has the same tolerance window as the earlier entry, which
+    always matches first (e.g. SCH 40 rows equal to STD, SCH 80 rows equal
+    to XS), so it can never decide a result.
+    """
+    seen = set()
+    for code, (schedule, entries) in enumerate(schedules):
+        for defined_od, defined_wt in entries:
+            if (defined_od, defined_wt) in seen:
+                continue
+            seen.add((defined_od, defined_wt))
+            yield code, schedule, defined_od, defined_wt
+
+def _wt_bucket_table(schedules) -> dict:
+    """
+    Index a schedule table by (floor(OD), floor(WT * WT_BUCKET_SCALE)) bucket.
+    
+    Each entry is added to every bucket its tolerance window overlaps, so a
+    lookup probes one bucket and only checks the few entries near the input.
+    Bucket lists keep the table order, preserving first-match priority.
+    """
+    pad = 1e-6
+    lookup = {}
+    for _, schedule, defined_od, defined_wt in _reachable_wt_entries(schedules):
+        od_low = math.floor(defined_od - WT_OD_TOLERANCE - pad)
+        od_high = math.floor(defined_od + WT_OD_TOLERANCE + pad)
+        wt_low = math.floor((defined_wt - WT_WT_TOLERANCE) * WT_BUCKET_SCALE - pad)
+        wt_high = math.floor((defined_wt + WT_WT_TOLERANCE) * WT_BUCKET_SCALE + pad)
+        for od_key in range(od_low, od_high + 1):
+            for wt_key in range(wt_low, wt_high + 1):
+                lookup.setdefault((od_key, wt_key), []).append((defined_od, defined_wt, schedule))
+    return lookup
+
+
+CARBON_WT_LOOKUP = _wt_bucket_table(CARBON_WT_SCHEDULES)
+STAINLESS_WT_LOOKUP = _wt_bucket_table(STAINLESS_WT_SCHEDULES)
+IS_WT_LOOKUP = _wt_bucket_table(IS_WT_SCHEDULES)
+
+def _lookup_wt_schedule(lookup: dict, od: float, wt: float, default: str) -> str:
+    """First schedule in a bucketed table matching od/wt within tolerance, else default."""
+    if not (math.isfinite(od) and math.isfinite(wt)):
+        return default
+    for defined_od, defined_wt, schedule in lookup.get((math.floor(od), math.floor(wt * WT_BUCKET_SCALE)), ()):
+        if abs(od - defined_od) <= WT_OD_TOLERANCE and abs(wt - defined_wt) <= WT_WT_TOLERANCE:
+            return schedule
+    return default
+
+
+def categorize_carbon(od, wt):
+    """Categorize WT schedule for Carbon/CS/AS grade types"""
+    try:
+        od = float(od)
+        wt = float(wt)
+    except:
+        return "Non STD"
+    
+    return _lookup_wt_schedule(CARBON_WT_LOOKUP, od, wt, "Non STD")
+
+def categorize_stainless(od, wt):
+    """Categorize WT schedule for Stainless Steel grade types"""
+    try:
+        od = float(od)
+        wt = float(wt)
+    except:
+        return "Non STD"
     
-    return "Non IS Standard"
+    return _lookup_wt_schedule(STAINLESS_WT_LOOKUP, od, wt, "Non STD")
+
+def categorize_is(od, wt):
+    """Categorize WT schedule for IS grade types"""
+    try:
+        od = float(od)
+        wt = float(wt)
+    except:
+        return "Non IS Standard"
+    
+    return _lookup_wt_schedule(IS_WT_LOOKUP, od, wt, "Non IS Standard")
 
 def categorize_WT_Tube(od, wt):
     """Categorize WT schedule for Tube grade types"""
@@ -478,57 +720,224 @@ def categorize_WT_Tube(od, wt):
     except:
         return "Non-Standard Tube"
     
-    # Light wall tubes
-    if (od, wt) in [
-        (6.35, 0.71), (6.35, 0.89), (9.53, 0.89), (9.53, 1.24), (12.70, 0.89), (12.70, 1.24),
-        (15.88, 0.89), (15.88, 1.24), (15.88, 1.65), (19.05, 0.89), (19.05, 1.24), (19.05, 1.65),
-        (22.23, 1.24), (22.23, 1.65), (25.40, 1.24), (25.40, 1.65), (31.75, 1.24), (31.75, 1.65),
-        (31.75, 2.11), (38.10, 1.65), (38.10, 2.11), (50.80, 1.65), (50.80, 2.11), (50.80, 2.77),
-        (63.50, 1.65), (63.50, 2.11), (63.50, 2.77), (76.20, 1.65), (76.20, 2.11), (76.20, 2.77),
-        (101.60, 2.11), (101.60, 2.77)
-    ]:
+    if (od, wt) in TUBE_SMALL_WALL:
         return "Small Wall Tube"
-    
-    # Medium wall tubes
-    if (od, wt) in [
-        (6.35, 1.24), (9.53, 1.65), (12.70, 1.65), (15.88, 2.11), (19.05, 2.11), (22.23, 2.11),
-        (25.40, 2.11), (31.75, 2.77), (38.10, 2.77), (50.80, 3.05), (63.50, 3.05), (76.20, 3.05),
-        (101.60, 3.05)
-    ]:
+    if (od, wt) in TUBE_MEDIUM_WALL:
         return "Medium Wall Tube"
-    
-    # Heavy wall tubes
-    if (od, wt) in [
-        (6.35, 1.65), (9.53, 2.11), (12.70, 2.11), (15.88, 2.77), (19.05, 2.77), (22.23, 2.77),
-        (25.40, 2.77), (31.75, 3.05), (38.10, 3.05), (50.80, 3.40), (63.50, 3.40), (76.20, 3.40),
-        (101.60, 3.40)
-    ]:
+    if (od, wt) in TUBE_HEAVY_WALL:
         return "Heavy Wall Tube"
-    
-    # Extra heavy wall tubes
-    if (od, wt) in [
-        (15.88, 3.05), (19.05, 3.05), (22.23, 3.05), (25.40, 3.05), (31.75, 3.40), (38.10, 3.40),
-        (50.80, 3.73), (63.50, 3.73), (76.20, 3.73), (101.60, 4.78)
-    ]:
+    if (od, wt) in TUBE_EXTRA_HEAVY_WALL:
         return "Non-Standard Tube"
     
     return "Non-Standard Tube"
 
+# Grade family for WT categorization in one regex pass. Each alternative is a
+# lookahead tried in order at the start, so the precedence of the original
+# substring checks is kept: tube, then is, then carbon/alloy, then stainless.
+_WT_GRADE_FAMILY_RE = re.compile(
+    r'(?:(?P<tube>(?=.*tube))'
+    r'|(?P<is>(?=.*is))'
+    r'|(?P<carbon>(?=.*(?:cs|carbon|as|alloy)))'
+    r'|(?P<stainless>(?=.*(?:ss|stainless))))',
+    re.DOTALL
+)
+
+_WT_FAMILY_CATEGORIZERS = {
+    'tube': categorize_WT_Tube,
+    'is': categorize_is,
+    'carbon': categorize_carbon,
+    'stainless': categorize_stainless,
+}
+
+@lru_cache(maxsize=256)
+def _wt_categorizer(grade):
+    """WT categorization function for a non-missing grade, or None if the grade is not recognized"""
+    match = _WT_GRADE_FAMILY_RE.match(str(grade).strip().lower())
+    return _WT_FAMILY_CATEGORIZERS[match.lastgroup] if match else None
+
+# Last ((od, wt, grade), schedule) per thread: consecutive rows often repeat the same pipe
+_WT_LAST_CALL = threading.local()
+
 def categorize_WT_schedule(od, wt, grade):
     """Main WT schedule categorization function"""
+    key = (od, wt, grade)
+    last = getattr(_WT_LAST_CALL, 'entry', None)
+    try:
+        if last is not None and last[0] == key:
+            return last[1]
+    except (TypeError, ValueError):
+        # Values without a plain boolean == (e.g. pd.NA) - just compute
+        pass
+    
     if pd.isna(grade):
-        return "Unknown"
-    grade_clean = str(grade).strip().lower()
-    if "tube" in grade_clean:
-        return categorize_WT_Tube(od, wt)
-    elif "is" in grade_clean:
-        return categorize_is(od, wt)
-    elif "cs" in grade_clean or "carbon" in grade_clean or "as" in grade_clean or "alloy" in grade_clean:
-        return categorize_carbon(od, wt)
-    elif "ss" in grade_clean or "stainless" in grade_clean:
-        return categorize_stainless(od, wt)
+        schedule = "Unknown"
     else:
-        return "Unknown"
+        categorizer = _wt_categorizer(grade)
+        if categorizer is None:
+            schedule = "Unknown"
+        else:
+            try:
+                schedule = _categorize_WT_cached(od, wt, categorizer)
+            except TypeError:
+                # Unhashable OD/WT value - categorize without the cache
+                schedule = categorizer(od, wt)
+    
+    _WT_LAST_CALL.entry = (key, schedule)
+    return schedule
+
+@lru_cache(maxsize=8192)
+def _categorize_WT_cached(od, wt, categorizer) -> str:
+    """WT schedule for an OD/WT pair and grade family categorizer, memoized across repeated inventory rows."""
+    return categorizer(od, wt)
+
+def _to_float(value) -> float:
+    """float(value) as the categorize_* functions coerce it, with NaN where that fails."""
+    try:
+        return float(value)
+    except:
+        return np.nan
+
+def _to_float_array(values) -> np.ndarray:
+    """
+    Coerce values to a float array the way the categorize_* functions do.
+    
+    Numeric arrays (the usual OD/WT columns) convert in one step; only
+    object values such as numeric strings go through float() one by one.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return np.asarray(values, dtype=np.float64)
+    return np.array([_to_float(value) for value in values], dtype=np.float64)
+
+# Row layout of the schedule tables used by the batch matcher: the defined
+# OD/WT pair, the schedule's index in its table (its label) and the entry's
+# position in scalar match order (its priority)
+WT_TABLE_DTYPE = np.dtype([('od', np.float64), ('wt', np.float64), ('sched', np.uint8), ('order', np.uint16)])
+
+def _wt_table_array(schedules) -> np.ndarray:
+    """Schedule table as a WT_TABLE_DTYPE structured array sorted by OD."""
+    table = np.array(
+        [(defined_od, defined_wt, code, order)
+         for order, (code, _, defined_od, defined_wt) in enumerate(_reachable_wt_entries(schedules))],
+        dtype=WT_TABLE_DTYPE
+    )
+    return table[np.argsort(table['od'], kind='stable')]
+
+def _wt_label_array(schedules, default: str) -> np.ndarray:
+    """Schedule labels indexed by the 'sched' field, with default last (index -1)."""
+    return np.array([schedule for schedule, _ in schedules] + [default], dtype=object)
+
+def _categorize_wt_batch(od: np.ndarray, wt: np.ndarray, table: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Batch equivalent of the tolerance-based categorize_* functions.
+    
+    Binary-searches the OD-sorted table for the rows within OD tolerance of
+    each pair, checks only those candidates, and takes the matching one that
+    comes first in the original table order, so priority matches the scalar
+    first-match scan.
+    
+    Args:
+        od: Float OD values (NaN for values that are not numbers)
+        wt: Float WT values aligned with od
+        table: Structured array from _wt_table_array(schedules)
+        labels: Label array from _wt_label_array(schedules, default)
+    
+    Returns:
+        Object ndarray of schedule labels
+    """
+    table_od = table['od']
+    table_wt = table['wt']
+    
+    # Candidate window per pair; the small pad only widens it, the exact
+    # tolerance test below decides
+    pad = 1e-6
+    low = np.searchsorted(table_od, od - WT_OD_TOLERANCE - pad, side='left')
+    high = np.searchsorted(table_od, od + WT_OD_TOLERANCE + pad, side='right')
+    width = int((high - low).max()) if len(od) else 0
+    if width <= 0:
+        return labels[np.full(len(od), -1)]
+    
+    candidates = low[:, None] + np.arange(width)
+    in_window = candidates < high[:, None]
+    candidates = np.minimum(candidates, len(table) - 1)
+    matches = (
+        in_window
+        & (np.abs(od[:, None] - table_od[candidates]) <= WT_OD_TOLERANCE)
+        & (np.abs(wt[:, None] - table_wt[candidates]) <= WT_WT_TOLERANCE)
+    )
+    
+    best = np.where(matches, table['order'][candidates], np.iinfo(np.uint16).max).argmin(axis=1)
+    rows = np.arange(len(od))
+    codes = np.where(matches[rows, best], table['sched'][candidates[rows, best]].astype(np.int64), -1)
+    return labels[codes]
+
+CARBON_WT_TABLE = _wt_table_array(CARBON_WT_SCHEDULES)
+STAINLESS_WT_TABLE = _wt_table_array(STAINLESS_WT_SCHEDULES)
+IS_WT_TABLE = _wt_table_array(IS_WT_SCHEDULES)
+
+# Categorizer per family code used by categorize_WT_vectorized (0 = unknown/missing grade)
+_WT_CATEGORIZERS = (None, categorize_carbon, categorize_stainless, categorize_is, categorize_WT_Tube)
+
+# Batch arguments (table, labels) for the tolerance-based families
+_WT_BATCH_TABLES = {
+    1: (CARBON_WT_TABLE, _wt_label_array(CARBON_WT_SCHEDULES, "Non STD")),
+    2: (STAINLESS_WT_TABLE, _wt_label_array(STAINLESS_WT_SCHEDULES, "Non STD")),
+    3: (IS_WT_TABLE, _wt_label_array(IS_WT_SCHEDULES, "Non IS Standard")),
+}
+
+def categorize_WT_vectorized(od_series: pd.Series, wt_series: pd.Series, grade_series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of categorize_WT_schedule() over whole columns.
+    
+    Inventory rows repeat the same OD/WT/grade combinations heavily, so rows
+    are reduced to their distinct (OD, WT, grade family) combinations with
+    factorize. CS/AS, SS and IS combinations are matched against the schedule
+    tables in one numpy batch per family; tube combinations use the exact-pair
+    lookup. Labels are broadcast back by integer code.
+    
+    Args:
+        od_series: OD values (numeric or numeric strings)
+        wt_series: WT values aligned with od_series
+        grade_series: Grade values aligned with od_series
+    
+    Returns:
+        Series of WT schedule labels with the same index as od_series
+    """
+    od_codes, od_uniques = pd.factorize(od_series)
+    wt_codes, wt_uniques = pd.factorize(wt_series)
+    grade_codes, grade_uniques = pd.factorize(grade_series)
+    
+    # Family code per row; missing grades (code -1) pick the trailing 0
+    family_codes = np.array(
+        [_WT_CATEGORIZERS.index(_wt_categorizer(grade)) for grade in grade_uniques] + [0],
+        dtype=np.int64
+    )[grade_codes]
+    
+    # One integer key per (OD, WT, family) combination
+    wt_span = len(wt_uniques) + 1
+    family_span = len(_WT_CATEGORIZERS)
+    combo_keys = ((od_codes.astype(np.int64) + 1) * wt_span + (wt_codes + 1)) * family_span + family_codes
+    combo_codes, combo_uniques = pd.factorize(combo_keys)
+    
+    # Decode each combination; missing OD/WT values (code -1) pick the trailing NaN
+    combo_rest, combo_family = np.divmod(combo_uniques, family_span)
+    combo_od_codes, combo_wt_codes = np.divmod(combo_rest, wt_span)
+    # Values are coerced to float once per distinct value, so nothing below needs
+    # a per-call try/except
+    od_values = np.append(_to_float_array(od_uniques), np.nan)[combo_od_codes - 1]
+    wt_values = np.append(_to_float_array(wt_uniques), np.nan)[combo_wt_codes - 1]
+    
+    labels = np.full(len(combo_uniques), "Unknown", dtype=object)
+    for family, (table, family_labels) in _WT_BATCH_TABLES.items():
+        in_family = combo_family == family
+        if in_family.any():
+            labels[in_family] = _categorize_wt_batch(
+                od_values[in_family], wt_values[in_family], table, family_labels
+            )
+    tube_family = _WT_CATEGORIZERS.index(categorize_WT_Tube)
+    for k in np.flatnonzero(combo_family == tube_family):
+        labels[k] = TUBE_WT_LABELS.get((od_values[k], wt_values[k]), "Non-Standard Tube")
+    
+    return pd.Series(labels[combo_codes], index=od_series.index, dtype=object)
 
 # ============================================================================
 # Data Categorization Function (copied from dashboard)
@@ -539,49 +948,30 @@ def add_categorizations(df):
     Add OD_Category and WT_Schedule columns to DataFrame.
     Copied from dashboard - exact same logic.
     """
+    if df.empty:
+        return df
+    
+    # Add OD_Category and WT_Schedule columns
+    # Use Grade_Logic if available, otherwise fall back to Grade
+    grade_col = 'Grade_Logic' if 'Grade_Logic' in df.columns else 'Grade'
+    
     try:
-        if df.empty:
-            return df
-        
-        # Add OD_Category and WT_Schedule columns
-        # Use Grade_Logic if available, otherwise fall back to Grade
-        grade_col = 'Grade_Logic' if 'Grade_Logic' in df.columns else 'Grade'
-        
         if 'OD' in df.columns and grade_col in df.columns:
-            # Vectorized OD categorization
-            od_values = df['OD'].values
-            grade_values = df[grade_col].values
-            
-            od_categories = []
-            for i in range(len(df)):
-                od_categories.append(categorize_OD(od_values[i], grade_values[i]))
-            df['OD_Category'] = od_categories
+            # Vectorized OD categorization (one binary search over the combined OD key table)
+            df['OD_Category'] = categorize_OD_vectorized(df['OD'], df[grade_col])
         else:
             df['OD_Category'] = "Unknown"
         
         if 'OD' in df.columns and 'WT' in df.columns and grade_col in df.columns:
-            # Vectorized WT categorization
-            od_values = df['OD'].values
-            wt_values = df['WT'].values
-            grade_values = df[grade_col].values
-            
-            wt_schedules = []
-            for i in range(len(df)):
-                wt_schedules.append(categorize_WT_schedule(od_values[i], wt_values[i], grade_values[i]))
-            df['WT_Schedule'] = wt_schedules
+            # Vectorized WT categorization (each distinct OD/WT/grade family once)
+            df['WT_Schedule'] = categorize_WT_vectorized(df['OD'], df['WT'], df[grade_col])
         else:
             df['WT_Schedule'] = "Unknown"
         
         return df
-    except (KeyError, ValueError, AttributeError, IndexError) as e:
-        # If categorization fails, return DataFrame with Unknown categories
-        if 'OD_Category' not in df.columns:
-            df['OD_Category'] = "Unknown"
-        if 'WT_Schedule' not in df.columns:
-            df['WT_Schedule'] = "Unknown"
-        return df
     except Exception as e:
-        # Unexpected error - return DataFrame with Unknown categories
+        # If categorization fails, return DataFrame with Unknown categories
+        logger.warning(f"Categorization failed, using Unknown categories: {e}")
         if 'OD_Category' not in df.columns:
             df['OD_Category'] = "Unknown"
         if 'WT_Schedule' not in df.columns:
@@ -592,69 +982,349 @@ def add_categorizations(df):
 # Highlight Function (copied from dashboard)
 # ============================================================================
 
-def highlight(val, minval, maxval, numeric_no_totals, size_chart_type="Free For Sale"):
+# OD categories highlighted with a star marker in the heatmap (same as dashboard)
+HIGHLIGHT_OD_CATEGORIES = frozenset(['2"', '4"', '6"', '8"', '10"', '12"', '14"', '16"', '18"', '20"'])
+
+# Greens scale (10 steps) - Lighter darkest green for better readability
+HEATMAP_GREEN_COLORS = [
+    "#F0FFF0", "#E0FFE0", "#C1FFC1", "#A3FFA3", "#85FF85", "#66FF66",
+    "#48D148", "#2E8B2E", "#1F601F", "#2E5A2E"
+]
+
+# Reds scale (10 steps) for negative values in "Compare Files" charts
+HEATMAP_RED_COLORS = [
+    "#FFF0F0", "#FFE0E0", "#FFC1C1", "#FFA3A3", "#FF8585",
+    "#FF6666", "#D14848", "#8B2E2E", "#601F1F", "#5A2E2E"
+]
+
+class HighlightContext(NamedTuple):
+    """Value ranges highlight() scales colors over, computed once per heatmap."""
+    pos_min: float
+    pos_max: float
+    neg_min: float
+    neg_max: float
+    is_empty: bool
+    size_chart_type: str
+
+def build_highlight_context(numeric_no_totals: pd.DataFrame, size_chart_type="Free For Sale") -> HighlightContext:
     """
-    Apply conditional formatting to heatmap cells.
-    Copied from dashboard - exact same color logic.
+    Compute the positive and negative value ranges of a heatmap once.
+    
+    Args:
+        numeric_no_totals: Numeric values without Total row/column, used for scaling
+        size_chart_type: Chart type ("Compare Files" shades negatives by magnitude)
+    
+    Returns:
+        HighlightContext; a range is (nan, nan) when there are no such values
+    """
+    values = numeric_no_totals.to_numpy(dtype=float)
+    positive = values[values > 0]
+    negative = values[values < 0]
+    return HighlightContext(
+        pos_min=positive.min() if positive.size else np.nan,
+        pos_max=positive.max() if positive.size else np.nan,
+        neg_min=negative.min() if negative.size else np.nan,
+        neg_max=negative.max() if negative.size else np.nan,
+        is_empty=not values.size,
+        size_chart_type=size_chart_type
+    )
+
+def highlight_cell(val, ctx: HighlightContext) -> str:
+    """
+    Apply conditional formatting to one heatmap cell using precomputed ranges.
+    
+    Args:
+        val: Cell value
+        ctx: Ranges from build_highlight_context()
+    
+    Returns:
+        CSS string for the cell
     """
     if pd.isna(val) or val == 0:
         return "background-color: #FFFFFF; color: #CCCCCC;"
     
     # Handle negative values with red coloring
     if val < 0:
-        if size_chart_type == "Compare Files":
-            red_colors = [
-                "#FFF0F0", "#FFE0E0", "#FFC1C1", "#FFA3A3", "#FF8585",
-                "#FF6666", "#D14848", "#8B2E2E", "#601F1F", "#5A2E2E"
-            ]
-            negative_vals = numeric_no_totals[numeric_no_totals < 0]
-            if not negative_vals.empty:
-                neg_min = negative_vals.min().min()
-                neg_max = negative_vals.max().max()
-                if neg_min < neg_max:
-                    idx = int((val - neg_max) / (neg_min - neg_max) * (len(red_colors) - 1))
-                else:
-                    idx = len(red_colors) - 1
-            else:
+        if ctx.size_chart_type == "Compare Files":
+            red_colors = HEATMAP_RED_COLORS
+            if ctx.is_empty:
                 idx = 0
+            elif ctx.neg_min < ctx.neg_max:
+                idx = int((val - ctx.neg_max) / (ctx.neg_min - ctx.neg_max) * (len(red_colors) - 1))
+            else:
+                # Single negative value (or none to scale by): darkest red
+                idx = len(red_colors) - 1
             idx = max(0, min(idx, len(red_colors) - 1))
             text_color = "#FFFFFF" if idx >= 7 else "#222"
             return f"background-color: {red_colors[idx]}; color: {text_color}; font-weight: bold;"
         else:
             return "background-color: #DC143C; color: #FFFFFF; font-weight: bold;"
     
-    # Greens scale (10 steps) - Lighter darkest green for better readability
-    colors = [
-        "#F0FFF0", "#E0FFE0", "#C1FFC1", "#A3FFA3", "#85FF85", "#66FF66",
-        "#48D148", "#2E8B2E", "#1F601F", "#2E5A2E"
-    ]
-    
-    # Normalize - use only positive values for scaling to ensure consistent light green
-    positive_vals = numeric_no_totals[numeric_no_totals > 0]
-    if not positive_vals.empty:
-        pos_minval = positive_vals.min().min()
-        pos_maxval = positive_vals.max().max()
-        if pos_maxval > pos_minval:
-            # Scale based on positive values only
-            idx = int((val - pos_minval) / (pos_maxval - pos_minval) * (len(colors) - 1))
-            idx = max(0, min(idx, len(colors) - 1))  # Ensure idx is within bounds
-        else:
-            idx = 0  # Use lightest green for single positive value
+    # Greens scale (10 steps), normalized over positive values only
+    colors = HEATMAP_GREEN_COLORS
+    if ctx.pos_max > ctx.pos_min:
+        idx = int((val - ctx.pos_min) / (ctx.pos_max - ctx.pos_min) * (len(colors) - 1))
+        idx = max(0, min(idx, len(colors) - 1))  # Ensure idx is within bounds
     else:
-        idx = 0  # Use lightest green if no positive values
+        idx = 0  # Use lightest green for a single positive value or none
     
     # Use white text for darker backgrounds (last 3 colors)
-    if idx >= 7:
-        text_color = "#FFFFFF"
-    else:
-        text_color = "#222"
+    text_color = "#FFFFFF" if idx >= 7 else "#222"
     
     return f"background-color: {colors[idx]}; color: {text_color}; font-weight: bold;"
 
+def highlight(val, minval, maxval, numeric_no_totals, size_chart_type="Free For Sale"):
+    """
+    Apply conditional formatting to heatmap cells.
+    Copied from dashboard - exact same color logic.
+    
+    Recomputes the value ranges on every call; when styling many cells, build
+    a HighlightContext once and use highlight_cell() (or highlight_frame()).
+    """
+    return highlight_cell(val, build_highlight_context(numeric_no_totals, size_chart_type))
+
+def _scale_color_index(values: np.ndarray, low: float, high: float, n_colors: int) -> np.ndarray:
+    """Color index per value as highlight() computes it: int((v - low) / (high - low) * (n - 1)), clipped."""
+    scaled = np.nan_to_num((values - low) / (high - low) * (n_colors - 1), nan=0.0)
+    return np.clip(np.trunc(scaled), 0, n_colors - 1).astype(np.int64)
+
+def _cell_styles(colors) -> np.ndarray:
+    """CSS for each color of a scale, with white text on the three darkest."""
+    return np.array(
+        [f"background-color: {color}; color: {'#FFFFFF' if i >= 7 else '#222'}; font-weight: bold;"
+         for i, color in enumerate(colors)],
+        dtype=object
+    )
+
+def highlight_frame(
+    data: pd.DataFrame,
+    numeric_no_totals: Optional[pd.DataFrame] = None,
+    size_chart_type="Free For Sale",
+    ctx: Optional[HighlightContext] = None
+) -> pd.DataFrame:
+    """
+    Vectorized highlight() for a whole frame, for use with Styler.apply(axis=None).
+    
+    The positive (and negative) value ranges are computed once from
+    numeric_no_totals instead of once per cell; colors are then picked for all
+    cells with numpy.
+    
+    Args:
+        data: Frame of cell values to style
+        numeric_no_totals: Numeric values without Total row/column, used for scaling
+            (not needed when ctx is given)
+        size_chart_type: Chart type ("Compare Files" shades negatives by magnitude)
+        ctx: Precomputed ranges from build_highlight_context(); takes precedence
+            over numeric_no_totals and size_chart_type
+    
+    Returns:
+        DataFrame of CSS strings with the same shape, index and columns as data
+    """
+    values = data.to_numpy(dtype=float)
+    if ctx is None:
+        ctx = build_highlight_context(numeric_no_totals, size_chart_type)
+    
+    styles = np.full(values.shape, "background-color: #FFFFFF; color: #CCCCCC;", dtype=object)
+    
+    # Positive values: greens scaled over the positive range (lightest if it is a single value)
+    positive = values > 0
+    green_idx = np.zeros(values.shape, dtype=np.int64)
+    if ctx.pos_max > ctx.pos_min:
+        green_idx = _scale_color_index(values, ctx.pos_min, ctx.pos_max, len(HEATMAP_GREEN_COLORS))
+    styles[positive] = _cell_styles(HEATMAP_GREEN_COLORS)[green_idx[positive]]
+    
+    # Negative values: reds scaled over the negative range for comparisons, crimson otherwise
+    negative = values < 0
+    if ctx.size_chart_type == "Compare Files":
+        # As in highlight_cell(): lightest red only for an empty frame, darkest when
+        # the negative range is a single value (or there are no negatives to scale by)
+        if ctx.is_empty:
+            red_idx = np.zeros(values.shape, dtype=np.int64)
+        elif ctx.neg_min < ctx.neg_max:
+            red_idx = _scale_color_index(values, ctx.neg_max, ctx.neg_min, len(HEATMAP_RED_COLORS))
+        else:
+            red_idx = np.full(values.shape, len(HEATMAP_RED_COLORS) - 1, dtype=np.int64)
+        styles[negative] = _cell_styles(HEATMAP_RED_COLORS)[red_idx[negative]]
+    else:
+        styles[negative] = "background-color: #DC143C; color: #FFFFFF; font-weight: bold;"
+    
+    return pd.DataFrame(styles, index=data.index, columns=data.columns)
+
 # ============================================================================
 # Main Heatmap Generation Function
 # ============================================================================
 
+# Last (inputs, Free For Sale result): a report run generates one heatmap per
+# specification from the same three source DataFrames
+_FFS_LAST_CALL = None
+_FFS_LOCK = threading.Lock()
+
+def _categorize_free_for_sale(free_for_sale_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add Grade/Grade_Logic (from each row's specification) and the
+    OD_Category/WT_Schedule columns to the whole Free For Sale frame.
+    
+    Categorization is row-wise, so doing it once here gives every
+    specification's slice the same columns as categorizing the slice itself.
+    """
+    if free_for_sale_df.empty or 'Specification' not in free_for_sale_df.columns:
+        return free_for_sale_df
+    
+    categorized = free_for_sale_df.copy()
+    spec_codes, unique_specs = pd.factorize(categorized['Specification'])
+    grades = np.append(derive_grades_from_specs(unique_specs, combine_cs_as=True), "Unknown")[spec_codes]
+    categorized['Grade'] = grades
+    categorized['Grade_Logic'] = grades
+    return add_categorizations(categorized)
+
+def _free_for_sale_cached(stock_df: pd.DataFrame, reservations_df: pd.DataFrame, incoming_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    calculate_free_for_sale() memoized on the identity and shape of its inputs,
+    with categorizations added by _categorize_free_for_sale().
+    
+    The cached entry holds references to the input frames, so their ids cannot
+    be reused by other objects while it is alive. Callers must treat the
+    returned frame as read-only.
+    """
+    global _FFS_LAST_CALL
+    inputs = (stock_df, reservations_df, incoming_df)
+    shapes = tuple(df.shape for df in inputs)
+    
+    with _FFS_LOCK:
+        last = _FFS_LAST_CALL
+        if last is not None and all(a is b for a, b in zip(last[0], inputs)) and last[1] == shapes:
+            logger.debug("Reusing Free For Sale data from the previous call")
+            return last[2]
+        
+        free_for_sale_df = _categorize_free_for_sale(calculate_free_for_sale(stock_df, reservations_df, incoming_df))
+        _FFS_LAST_CALL = (inputs, shapes, free_for_sale_df)
+        return free_for_sale_df
+
+# Factorized stripped 'Specification' column per source frame, by id(frame):
+# (frame, row count, codes, stripped specifications)
+_SPEC_CODES = {}
+
+def _specification_mask(df: pd.DataFrame, specification: str) -> np.ndarray:
+    """
+    Boolean mask of rows whose stripped 'Specification' equals specification.
+    
+    Equivalent to df['Specification'].str.strip() == specification, but the
+    column is stripped and factorized once per frame; each further
+    specification is an integer comparison. Like _free_for_sale_cached(),
+    this assumes frames are not modified in place during a report run.
+    
+    Args:
+        df: Frame with a 'Specification' column
+        specification: Already stripped specification name
+    
+    Returns:
+        Boolean ndarray aligned with df's rows
+    """
+    codes, uniques = _specification_codes(df)
+    matches = np.flatnonzero(uniques == specification)
+    if not len(matches):
+        return np.zeros(len(codes), dtype=bool)
+    return codes == matches[0]
+
+def _specification_codes(df: pd.DataFrame) -> Tuple[np.ndarray, pd.Index]:
+    """Factorized stripped 'Specification' column of df, memoized per frame."""
+    with _FFS_LOCK:
+        entry = _SPEC_CODES.get(id(df))
+        if entry is None or entry[0] is not df or entry[1] != len(df):
+            codes, uniques = pd.factorize(df['Specification'].str.strip())
+            entry = (df, len(df), codes, pd.Index(uniques))
+            _SPEC_CODES[id(df)] = entry
+    return entry[2], entry[3]
+
+# 'MT' total per stripped specification for each source frame, by id(frame):
+# (frame, row count, {specification: total})
+_SPEC_MT_TOTALS = {}
+
+def _specification_mt_total(df: pd.DataFrame, specification: str) -> float:
+    """
+    Sum of 'MT' over the rows whose stripped 'Specification' equals specification.
+    
+    The totals of every specification in df are computed on first use from
+    one stable sort by specification code, and looked up afterwards. Each
+    total is a numpy sum over the same values in the same order as summing
+    the filtered rows, so it is identical to df[mask]['MT'].sum().
+    
+    Args:
+        df: Source frame (Stock, Reservations or Incoming)
+        specification: Already stripped specification name
+    
+    Returns:
+        Total MT, 0.0 when the specification has no rows or df lacks the columns
+    """
+    if 'Specification' not in df.columns or 'MT' not in df.columns:
+        return 0.0
+    mt_dtype = df['MT'].dtype
+    if not (isinstance(mt_dtype, np.dtype) and mt_dtype.kind in 'iuf'):
+        # Object/extension dtypes: sum the filtered rows as pandas does
+        filtered = df[_specification_mask(df, specification)]
+        return float(filtered['MT'].sum()) if not filtered.empty else 0.0
+    
+    codes, uniques = _specification_codes(df)
+    with _FFS_LOCK:
+        entry = _SPEC_MT_TOTALS.get(id(df))
+        if entry is None or entry[0] is not df or entry[1] != len(df):
+            order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[order]
+            sorted_mt = df['MT'].to_numpy()[order]
+            if mt_dtype.kind == 'f':
+                # Missing values count as 0, as Series.sum skips them
+                sorted_mt = np.where(np.isnan(sorted_mt), 0.0, sorted_mt)
+            starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            ends = np.r_[starts[1:], len(sorted_codes)]
+            totals = {
+                uniques[sorted_codes[start]]: float(sorted_mt[start:end].sum())
+                for start, end in zip(starts, ends) if sorted_codes[start] >= 0
+            }
+            entry = (df, len(df), totals)
+            _SPEC_MT_TOTALS[id(df)] = entry
+    
+    return entry[2].get(specification, 0.0)
+
+def clear_heatmap_cache() -> None:
+    """Drop the memoized Free For Sale data, specification codes and MT totals (and the frames they reference)."""
+    global _FFS_LAST_CALL
+    with _FFS_LOCK:
+        _FFS_LAST_CALL = None
+        _SPEC_CODES.clear()
+        _SPEC_MT_TOTALS.clear()
+
+def _add_totals(pivot: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append a "Total" column of row sums and a "Total" row of column sums.
+    
+    The totals are summed on the ndarray and the result is built as one
+    frame, instead of inserting a column and concatenating a row.
+    
+    Args:
+        pivot: Numeric pivot (OD categories x WT schedules)
+    
+    Returns:
+        New DataFrame with the totals row and column; the index loses its name
+        and both axes become object Indexes, as with the column insert + concat
+    """
+    # Sum with DataFrame.sum over the same memory layout as the dashboard's
+    # pivot (each OD row contiguous): numpy's summation order depends on the
+    # layout, and a different order can move a total across a .xx5 rounding tie
+    values = np.ascontiguousarray(pivot.to_numpy(dtype=np.float64))
+    frame = pd.DataFrame(values, copy=False)
+    row_totals = frame.sum(axis=1).to_numpy()
+    
+    out = np.empty((values.shape[0] + 1, values.shape[1] + 1), dtype=np.float64)
+    out[:-1, :-1] = values
+    out[:-1, -1] = row_totals
+    out[-1, :-1] = frame.sum(axis=0).to_numpy()
+    out[-1, -1] = row_totals.sum()
+    return pd.DataFrame(
+        out,
+        index=pd.Index(list(pivot.index) + ["Total"], dtype=object),
+        columns=pd.Index(list(pivot.columns) + ["Total"], dtype=object, name=pivot.columns.name)
+    )
+
 def generate_heatmap_dataframe(
     stock_df: pd.DataFrame,
     reservations_df: pd.DataFrame,
@@ -695,8 +1365,8 @@ def generate_heatmap_dataframe(
             raise ImportError("calculate_free_for_sale function not available from comparison_tab")
         
         # Step 1: Calculate Free For Sale (reuse existing function)
-        logger.info(f"Calculating Free For Sale for specification: {specification}")
-        free_for_sale_df = calculate_free_for_sale(stock_df, reservations_df, incoming_df)
+        logger.info("Calculating Free For Sale for specification: %s", specification)
+        free_for_sale_df = _free_for_sale_cached(stock_df, reservations_df, incoming_df)
         
         if free_for_sale_df.empty:
             raise ValueError(f"No data available for Free For Sale calculation")
@@ -706,24 +1376,31 @@ def generate_heatmap_dataframe(
             raise ValueError("'Specification' column not found in Free For Sale data")
         
         # Filter by specification (exact match, case-sensitive)
-        df_filtered = free_for_sale_df[free_for_sale_df['Specification'].str.strip() == specification.strip()].copy()
+        spec_norm = specification.strip()
+        # Boolean indexing already returns new data; the slice is only read below
+        df_filtered = free_for_sale_df[_specification_mask(free_for_sale_df, spec_norm)]
         
         if df_filtered.empty:
             raise ValueError(f"No data found for specification: {specification}")
         
-        logger.info(f"Filtered {len(df_filtered)} rows for specification: {specification}")
+        logger.info("Filtered %d rows for specification: %s", len(df_filtered), specification)
         
         # Step 3: Add categorizations (OD_Category, WT_Schedule)
         # First, we need to derive Grade from specification
         grade_type = derive_grade_type_from_spec(specification)
         
-        # Add Grade column if not present (needed for categorization)
-        if 'Grade' not in df_filtered.columns and 'Grade_Logic' not in df_filtered.columns:
-            df_filtered['Grade'] = grade_type
-            df_filtered['Grade_Logic'] = grade_type
-        
-        # Add categorizations
-        df_filtered = add_categorizations(df_filtered)
+        # The Free For Sale frame is categorized once per run; only
+        # categorize here if it could not be
+        if 'OD_Category' not in df_filtered.columns or 'WT_Schedule' not in df_filtered.columns:
+            df_filtered = df_filtered.copy()
+            
+            # Add Grade column if not present (needed for categorization)
+            if 'Grade' not in df_filtered.columns and 'Grade_Logic' not in df_filtered.columns:
+                df_filtered['Grade'] = grade_type
+                df_filtered['Grade_Logic'] = grade_type
+            
+            # Add categorizations
+            df_filtered = add_categorizations(df_filtered)
         
         # Validate required columns after categorization
         required_cols = ['OD_Category', 'WT_Schedule', 'MT']
@@ -733,110 +1410,86 @@ def generate_heatmap_dataframe(
         
         # Step 4: Determine WT schedule order based on grade type
         # This matches the dashboard logic for selecting appropriate WT schedules
-        if grade_type == "CS & AS":
-            wt_schedule = [s for s in CS_AS_WT if s in df_filtered['WT_Schedule'].unique()]
-        elif grade_type == "SS":
-            wt_schedule = [s for s in SS_WT if s in df_filtered['WT_Schedule'].unique()]
-        elif grade_type == "IS":
-            wt_schedule = [s for s in IS_WT if s in df_filtered['WT_Schedule'].unique()]
-        elif grade_type == "Tubes":
-            wt_schedule = [s for s in TUBES_WT if s in df_filtered['WT_Schedule'].unique()]
+        available_wt = df_filtered['WT_Schedule'].unique()
+        wt_order = WT_ORDER_BY_GRADE_TYPE.get(grade_type)
+        if wt_order is not None:
+            present_wt = set(available_wt.tolist())
+            wt_schedule = [s for s in wt_order if s in present_wt]
         else:
             # Unknown grade - use all available schedules
-            wt_schedule = sorted(df_filtered['WT_Schedule'].unique().tolist())
+            wt_schedule = sorted(available_wt.tolist())
         
         # Ensure we have at least some schedules
         if not wt_schedule:
-            logger.warning(f"No WT schedules found for specification {specification}. Using all available.")
-            wt_schedule = sorted(df_filtered['WT_Schedule'].unique().tolist())
+            logger.warning("No WT schedules found for specification %s. Using all available.", specification)
+            wt_schedule = sorted(available_wt.tolist())
         
         # Step 5: Create pivot table (same logic as dashboard)
-        logger.info(f"Creating pivot table for specification: {specification}")
-        
-        # Build base DataFrame with all combinations
-        import itertools
-        base_index = pd.MultiIndex.from_product([OD_ORDER, wt_schedule], names=["OD_Category", "WT_Schedule"])
-        df_base = pd.DataFrame(index=base_index).reset_index()
+        logger.info("Creating pivot table for specification: %s", specification)
         
-        # Group and sum - ensure metric column is numeric before summing
+        # Group on ordered categoricals: observed=False yields every OD x WT combination
+        # in display order, so no base frame, merge or reindex is needed
+        wt_cat = pd.CategoricalDtype(wt_schedule, ordered=True)
+        # Convert MT column to numeric, handling any non-numeric values
+        mt = pd.to_numeric(df_filtered['MT'], errors='coerce').fillna(0)
         try:
-            # Convert MT column to numeric, handling any non-numeric values
-            if 'MT' in df_filtered.columns:
-                df_filtered['MT'] = pd.to_numeric(df_filtered['MT'], errors='coerce').fillna(0)
-            grouped = df_filtered.groupby(["OD_Category", "WT_Schedule"])['MT'].sum().reset_index()
+            od_codes = df_filtered['OD_Category'].astype(OD_CAT)
+            wt_codes = df_filtered['WT_Schedule'].astype(wt_cat)
+            grouped = mt.groupby([od_codes, wt_codes], observed=False).sum()
+            pivot = grouped.unstack().astype(float)
+            pivot.index = pd.Index(OD_ORDER, name="OD_Category")
+            pivot.columns = pd.Index(wt_schedule, name="WT_Schedule")
         except (ValueError, TypeError) as e:
-            logger.error(f"Error grouping data: {e}")
-            grouped = df_base.copy()
-            grouped['MT'] = 0
-        
-        # Merge with base to ensure all combinations exist
-        merged = pd.merge(df_base, grouped, on=["OD_Category", "WT_Schedule"], how="left").fillna(0)
-        
-        # Pivot
-        pivot = merged.pivot(index="OD_Category", columns="WT_Schedule", values="MT")
-        
-        # Keep only the fixed order
-        pivot = pivot.reindex(index=OD_ORDER, columns=wt_schedule, fill_value=0)
+            logger.error("Error grouping data: %s", e)
+            pivot = pd.DataFrame(
+                0.0,
+                index=pd.Index(OD_ORDER, name="OD_Category"),
+                columns=pd.Index(wt_schedule, name="WT_Schedule")
+            )
         
         # Remove all-zero rows except for totals (we'll add totals next)
         pivot = pivot.loc[~((pivot == 0).all(axis=1)) | (pivot.index == "Total")]
         
-        # Add row totals
-        pivot["Total"] = pivot.sum(axis=1)
+        # Add row and column totals
+        pivot = _add_totals(pivot)
         
-        # Add column totals
-        col_total = pivot.sum(axis=0)
-        col_total.name = "Total"
-        pivot = pd.concat([pivot, col_total.to_frame().T])
-        
-        # Format all numeric values to 2 decimals (same as dashboard)
-        pivot = pivot.applymap(lambda x: round(x, 2) if isinstance(x, (int, float)) else x)
+        # Format all numeric values to 2 decimals (same as dashboard). Round each
+        # cell with Python's round(): DataFrame.round() scales by 100 and rounds
+        # half to even, which differs on .xx5 ties (e.g. 35.905 -> 35.9 vs 35.91)
+        pivot = pivot.map(lambda x: round(x, 2))
         
         # Step 6: Apply conditional formatting (same as dashboard)
-        # Only color the numeric cells (not OD_Category)
-        numeric = pivot.select_dtypes(include=[float, int])
-        # Exclude the "Total" row and column for color calculation
-        numeric_no_totals = numeric.drop('Total', axis=1, errors='ignore').drop('Total', axis=0, errors='ignore')
-        minval = numeric_no_totals.min().min() if not numeric_no_totals.empty else 0
-        maxval = numeric_no_totals.max().max() if not numeric_no_totals.empty else 1
-        
-        # Define OD categories to highlight with star marker (same as dashboard)
-        highlight_od_categories = ['2"', '4"', '6"', '8"', '10"', '12"', '14"', '16"', '18"', '20"']
+        # The pivot is all numeric and _add_totals() appends the "Total" row and
+        # column last, so excluding them from the color calculation is a slice
+        # Reduce them to the color scale ranges up front, so the Styler keeps
+        # only those and not a frame of values until it renders
+        highlight_ctx = build_highlight_context(pivot.iloc[:-1, :-1], metric)
         
         # Create a modified pivot with highlighted OD categories
         pivot_highlighted = pivot.copy()
         
         # Add star marker prefix to highlighted OD categories (using "*" instead of emoji for font compatibility)
-        new_index = []
-        for idx in pivot_highlighted.index:
-            if idx in highlight_od_categories:
-                new_index.append(f"* {idx}")
-            else:
-                new_index.append(idx)
-        pivot_highlighted.index = new_index
+        pivot_highlighted.index = [f"* {idx}" if idx in HIGHLIGHT_OD_CATEGORIES else idx for idx in pivot_highlighted.index]
         
         # Apply styling
         styled = (
             pivot_highlighted.style
             .format("{:.2f}")
-            .applymap(
-                lambda v: highlight(v, minval, maxval, numeric_no_totals, metric),
-                subset=pd.IndexSlice[pivot_highlighted.index, pivot_highlighted.columns]
+            .apply(
+                highlight_frame,
+                axis=None,
+                subset=pd.IndexSlice[pivot_highlighted.index, pivot_highlighted.columns],
+                ctx=highlight_ctx
             )
         )
         
         # Step 7: Calculate summary metrics
-        # Calculate totals from original dataframes (filtered by specification)
-        # Filter original dataframes by specification
-        stock_filtered = stock_df[stock_df['Specification'].str.strip() == specification.strip()] if 'Specification' in stock_df.columns else pd.DataFrame()
-        reservations_filtered = reservations_df[reservations_df['Specification'].str.strip() == specification.strip()] if 'Specification' in reservations_df.columns else pd.DataFrame()
-        incoming_filtered = incoming_df[incoming_df['Specification'].str.strip() == specification.strip()] if 'Specification' in incoming_df.columns else pd.DataFrame()
-        
-        # Calculate totals
-        stock_total = float(stock_filtered['MT'].sum()) if not stock_filtered.empty and 'MT' in stock_filtered.columns else 0.0
-        reservation_total = float(reservations_filtered['MT'].sum()) if not reservations_filtered.empty and 'MT' in reservations_filtered.columns else 0.0
-        incoming_total = float(incoming_filtered['MT'].sum()) if not incoming_filtered.empty and 'MT' in incoming_filtered.columns else 0.0
-        free_for_sale_total = float(df_filtered['MT'].sum())
+        # Calculate totals from original dataframes (filtered by specification);
+        # each frame's per-specification totals are computed once per run
+        stock_total = _specification_mt_total(stock_df, spec_norm)
+        reservation_total = _specification_mt_total(reservations_df, spec_norm)
+        incoming_total = _specification_mt_total(incoming_df, spec_norm)
+        free_for_sale_total = float(mt.sum())
         
         metrics_dict = {
             'stock': round(stock_total, 2),
@@ -845,8 +1498,8 @@ def generate_heatmap_dataframe(
             'free_for_sale': round(free_for_sale_total, 2)
         }
         
-        logger.info(f"Successfully generated heatmap for specification: {specification}")
-        logger.info(f"Metrics: {metrics_dict}")
+        logger.info("Successfully generated heatmap for specification: %s", specification)
+        logger.info("Metrics: %s", metrics_dict)
         
         return styled, metrics_dict, None
         
@@ -920,7 +1573,7 @@ def generate_heatmap_image(
         # Ensure output directory exists
         try:
             os.makedirs(output_dir, exist_ok=True)
-            logger.debug(f"Output directory ensured: {output_dir}")
+            logger.debug("Output directory ensured: %s", output_dir)
         except OSError as e:
             error_msg = f"Failed to create output directory '{output_dir}': {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -932,51 +1585,45 @@ def generate_heatmap_image(
         filename = f"{HEATMAP_IMAGE_PREFIX}{safe_spec}{HEATMAP_IMAGE_EXTENSION}"
         image_path = os.path.join(output_dir, filename)
         
-        logger.info(f"Converting styled DataFrame to PNG: {image_path}")
+        logger.info("Converting styled DataFrame to PNG: %s", image_path)
         
-        # Convert styled DataFrame to PNG image
+        # Convert styled DataFrame to PNG image in memory, then write it
+        # atomically so a failed export never leaves a partial file behind
         # Using matplotlib backend for better compatibility
+        temp_path = f"{image_path}.tmp"
         try:
+            buffer = io.BytesIO()
             dfi.export(
                 styled_dataframe,
-                image_path,
+                buffer,
                 table_conversion='matplotlib',
                 dpi=150  # High resolution for clear images
             )
-            logger.info(f"Successfully generated PNG image: {image_path}")
+            image_bytes = buffer.getvalue()
             
-            # Verify file was created
-            if not os.path.exists(image_path):
-                error_msg = f"Image file was not created at expected path: {image_path}"
+            # Check image size (should be > 0)
+            if not image_bytes:
+                error_msg = f"Generated image is empty for specification: {specification}"
                 logger.error(error_msg)
                 return False, None, error_msg
             
-            # Check file size (should be > 0)
-            file_size = os.path.getsize(image_path)
-            if file_size == 0:
-                error_msg = f"Generated image file is empty: {image_path}"
-                logger.error(error_msg)
-                # Clean up empty file
-                try:
-                    os.remove(image_path)
-                except Exception:
-                    pass
-                return False, None, error_msg
+            with open(temp_path, 'wb') as f:
+                f.write(image_bytes)
+            os.replace(temp_path, image_path)
             
-            logger.info(f"Image file created successfully: {image_path} ({file_size} bytes)")
+            logger.info("Image file created successfully: %s (%d bytes)", image_path, len(image_bytes))
             return True, image_path, None
             
         except Exception as e:
             error_msg = f"Failed to export styled DataFrame to PNG: {str(e)}"
             logger.error(error_msg, exc_info=True)
             
-            # Clean up partial file if it exists
-            if os.path.exists(image_path):
-                try:
-                    os.remove(image_path)
-                    logger.debug(f"Cleaned up partial image file: {image_path}")
-                except Exception:
-                    pass
+            # Clean up partial temp file if it exists
+            try:
+                os.remove(temp_path)
+                logger.debug("Cleaned up partial image file: %s", temp_path)
+            except OSError:
+                pass
             
             return False, None, error_msg
         
@@ -1000,3 +1647,67 @@ def generate_heatmap_image(
         logger.error(error_msg, exc_info=True)
         return False, None, error_msg
 
+# ============================================================================
+# Batch Generation Function
+# ============================================================================
+
+def _generate_heatmap_and_image(
+    stock_df: pd.DataFrame,
+    reservations_df: pd.DataFrame,
+    incoming_df: pd.DataFrame,
+    specification: str
+) -> Tuple[str, Optional[str], Optional[dict], Optional[str]]:
+    """
+    Generate the heatmap and its PNG image for one specification.
+    
+    Returns:
+        Tuple of (specification, image_path, metrics_dict, error_message);
+        metrics_dict is kept when only the image export failed
+    """
+    logger.info(f"  Processing specification: {specification}")
+    try:
+        styled_df, metrics, error = generate_heatmap_dataframe(
+            stock_df=stock_df,
+            reservations_df=reservations_df,
+            incoming_df=incoming_df,
+            specification=specification
+        )
+        if error or styled_df is None:
+            return specification, None, None, f"Failed to generate heatmap DataFrame for {specification}: {error}"
+        
+        success, image_path, image_error = generate_heatmap_image(
+            styled_dataframe=styled_df,
+            specification=specification
+        )
+        if not success or image_error:
+            return specification, None, metrics, f"Failed to generate heatmap image for {specification}: {image_error}"
+        
+        return specification, image_path, metrics, None
+        
+    except Exception as e:
+        error_msg = f"Exception while processing {specification}: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return specification, None, None, error_msg
+
+def generate_heatmaps_batch(
+    stock_df: pd.DataFrame,
+    reservations_df: pd.DataFrame,
+    incoming_df: pd.DataFrame,
+    specifications: List[str]
+) -> Iterator[Tuple[str, Optional[str], Optional[dict], Optional[str]]]:
+    """
+    Generate heatmaps and PNG images for several specifications, in-process and
+    in order. Free For Sale is computed once and shared by all specifications.
+    
+    Args:
+        stock_df: DataFrame from Stock sheet
+        reservations_df: DataFrame from Reservations sheet
+        incoming_df: DataFrame from Incoming sheet
+        specifications: Specification names to generate
+    
+    Returns:
+        Iterator of (specification, image_path, metrics_dict, error_message)
+        in the order of specifications
+    """
+    for specification in specifications:
+        yield _generate_heatmap_and_image(stock_df, reservations_df, incoming_df, specification)
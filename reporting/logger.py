@@ -5,18 +5,70 @@ This module provides a singleton-style logger configuration for all reporting mo
 Ensures consistent log formatting and file/console handlers across the codebase.
 """
 
-import os
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
-from reporting.config import LOGS_DIR, LOG_FILENAME
+from reporting.config import LOGS_DIR, LOG_FILENAME, LOG_LEVEL
 
 # Global logger instance cache
 _loggers = {}
 
+# Records from every reporting logger go through one queue; a single background
+# listener writes them to the shared file and console handlers, so callers
+# never wait on disk I/O
+_log_queue = queue.Queue(-1)
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    """
+    Create the file and console handlers and start the queue listener (once).
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        
+        # Create logs directory if it doesn't exist
+        logs_path = Path(LOGS_DIR)
+        logs_path.mkdir(parents=True, exist_ok=True)
+        
+        # Log file path
+        log_file_path = logs_path / LOG_FILENAME
+        
+        # Create formatter
+        formatter = logging.Formatter(
+            fmt='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        
+        # File handler (all levels enabled on the logger); the file is opened
+        # on the first record rather than when the first module is imported
+        file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8', delay=True)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        
+        # Console handler (INFO and above)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        
+        _listener = logging.handlers.QueueListener(
+            _log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        # Drain queued records and close the file on interpreter exit
+        atexit.register(_listener.stop)
+
 
 def _setup_logger(name: str) -> logging.Logger:
     """
-    Internal function to set up a logger with file and console handlers.
+    Internal function to set up a logger that hands records to the shared
+    file and console handlers through the log queue.
     
     Args:
         name: Logger name (typically __name__ from calling module)
@@ -30,33 +82,14 @@ def _setup_logger(name: str) -> logging.Logger:
     if logger.handlers:
         return logger
     
-    # Set logger level
-    logger.setLevel(logging.DEBUG)
-    
-    # Create logs directory if it doesn't exist
-    logs_path = Path(LOGS_DIR)
-    logs_path.mkdir(parents=True, exist_ok=True)
-    
-    # Log file path
-    log_file_path = logs_path / LOG_FILENAME
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # File handler (all levels)
-    file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Set logger level (DEBUG unless LOG_LEVEL asks for another level)
+    level = logging.getLevelName(LOG_LEVEL)
+    if not isinstance(level, int):
+        level = logging.DEBUG
+    logger.setLevel(level)
     
-    # Console handler (INFO and above)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    _start_listener()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
     
     return logger
 
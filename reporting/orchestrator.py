@@ -12,7 +12,9 @@ This is pure orchestration/glue code - no business logic.
 All business logic lives in the individual modules.
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Tuple, Optional
 import pandas as pd
@@ -20,15 +22,14 @@ import pandas as pd
 from reporting.config import (
     PDF_SPECIFICATIONS,
     EMAIL_RECIPIENTS,
-    EMAIL_SUBJECT_TEMPLATE,
     DATE_FORMAT_DISPLAY,
     LOGS_DIR,
     LOG_FILENAME,
     ERP_SYSTEM_LINK
 )
-from reporting.data_preprocessor import preprocess_inventory_data
+from reporting.data_preprocessor import load_inventory_data
 from reporting.priority_items_generator import generate_priority_items
-from reporting.heatmap_generator import generate_heatmap_dataframe, generate_heatmap_image
+from reporting.heatmap_generator import generate_heatmaps_batch, clear_heatmap_cache, get_specification_mapping
 from reporting.pdf_generator import generate_inventory_pdf
 from reporting.email_sender import send_email
 from reporting.email_body_generator import generate_inventory_email_body, generate_email_subject
@@ -37,6 +38,9 @@ from reporting.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Log file path reported at the start of every run
+_LOG_PATH = os.path.join(LOGS_DIR, LOG_FILENAME)
+
 
 def format_date(date_value: datetime) -> str:
     """
@@ -53,6 +57,22 @@ def format_date(date_value: datetime) -> str:
     return str(date_value)
 
 
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a file, returning None where os.path.exists() would return False.
+    
+    Args:
+        path: File path to stat
+    
+    Returns:
+        os.stat_result, or None if the path cannot be stat'ed
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 def _parse_dry_run_email_env() -> Optional[bool]:
     """
     Parse DRY_RUN_EMAIL environment variable.
@@ -142,7 +162,7 @@ def run_inventory_reporting_pipeline(
         logger.info("=" * 70)
         logger.info(f"Report date: {format_date(report_date) if report_date else 'Not provided (will use current date)'}")
         logger.info(f"Dry run email mode: {'ENABLED' if dry_run_email else 'DISABLED'}")
-        logger.info(f"Log file: {os.path.join(LOGS_DIR, LOG_FILENAME)}")
+        logger.info(f"Log file: {_LOG_PATH}")
         logger.info("=" * 70)
         logger.info("")
         
@@ -156,7 +176,7 @@ def run_inventory_reporting_pipeline(
             logger.info(f"Using local Excel file override: {excel_file_path}")
             
             # Input validation: Check if local override file exists
-            if not os.path.exists(excel_file_path):
+            if _stat_or_none(excel_file_path) is None:
                 error_msg = f"Local Excel file not found: {excel_file_path}"
                 logger.error(error_msg)
                 return False, error_msg
@@ -169,7 +189,11 @@ def run_inventory_reporting_pipeline(
             logger.info("No local file path provided. Fetching latest inventory file from S3...")
             
             try:
-                success, file_path, s3_last_modified, error = fetch_latest_inventory_file()
+                # Load the specification mapping (needed from Step 1 on) while the
+                # download is in flight; leaving the block waits for both
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(get_specification_mapping)
+                    success, file_path, s3_last_modified, error = fetch_latest_inventory_file()
                 
                 if not success:
                     error_msg = f"Failed to fetch latest inventory file from S3: {error}"
@@ -214,7 +238,7 @@ def run_inventory_reporting_pipeline(
         logger.info(f"Loading Excel file: {resolved_excel_path}")
         
         try:
-            sheets = preprocess_inventory_data(resolved_excel_path)
+            sheets = load_inventory_data(resolved_excel_path)
         except ValueError as e:
             # This catches missing sheets or file opening errors
             error_msg = f"Failed to preprocess inventory data: {str(e)}"
@@ -296,24 +320,15 @@ def run_inventory_reporting_pipeline(
         metrics_by_spec = {}
         failed_specs = []
         
-        for spec in PDF_SPECIFICATIONS:
-            logger.info(f"  Processing specification: {spec}")
-            
-            try:
-                # Generate heatmap DataFrame
-                styled_df, metrics, error = generate_heatmap_dataframe(
-                    stock_df=stock_df,
-                    reservations_df=reservations_df,
-                    incoming_df=incoming_df,
-                    specification=spec
-                )
-                
-                if error or styled_df is None:
-                    error_msg = f"Failed to generate heatmap DataFrame for {spec}: {error}"
-                    logger.error(error_msg)
-                    failed_specs.append(spec)
-                    continue
-                
+        heatmap_results = generate_heatmaps_batch(
+            stock_df=stock_df,
+            reservations_df=reservations_df,
+            incoming_df=incoming_df,
+            specifications=PDF_SPECIFICATIONS
+        )
+        
+        try:
+            for spec, image_path, metrics, error in heatmap_results:
                 # Store metrics
                 if metrics:
                     metrics_by_spec[spec] = metrics
@@ -321,42 +336,33 @@ def run_inventory_reporting_pipeline(
                     reservation_val = metrics.get('reservation', 0)
                     incoming_val = metrics.get('incoming', 0)
                     free_for_sale_val = metrics.get('free_for_sale', 0)
-                    
-                    logger.debug(f"  Metrics for {spec}: Stock={stock_val:.2f}, "
-                               f"Reservation={reservation_val:.2f}, "
-                               f"Incoming={incoming_val:.2f}, "
-                               f"Free For Sale={free_for_sale_val:.2f}")
-                    
+                
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"  Metrics for {spec}: Stock={stock_val:.2f}, "
+                                   f"Reservation={reservation_val:.2f}, "
+                                   f"Incoming={incoming_val:.2f}, "
+                                   f"Free For Sale={free_for_sale_val:.2f}")
+                
                     # Data sanity checks (non-blocking warnings)
                     if incoming_val == 0:
-                        logger.debug(f"  Note: Incoming MT is 0 for {spec}")
-                    
+                        logger.debug("  Note: Incoming MT is 0 for %s", spec)
+                
                     if reservation_val > stock_val:
                         logger.warning(f"  Data check: Reservation MT ({reservation_val:.2f}) > Stock MT ({stock_val:.2f}) for {spec}")
-                    
+                
                     if free_for_sale_val < 0:
                         logger.warning(f"  Data check: Free For Sale MT is negative ({free_for_sale_val:.2f}) for {spec}")
                 
-                # Generate heatmap image
-                success, image_path, image_error = generate_heatmap_image(
-                    styled_dataframe=styled_df,
-                    specification=spec
-                )
-                
-                if not success or image_error:
-                    error_msg = f"Failed to generate heatmap image for {spec}: {image_error}"
-                    logger.error(error_msg)
+                if error or image_path is None:
+                    logger.error(error)
                     failed_specs.append(spec)
                     continue
                 
                 heatmap_images_by_spec[spec] = image_path
                 logger.info(f"  ✓ {spec}: Image generated at {image_path}")
-                
-            except Exception as e:
-                error_msg = f"Exception while processing {spec}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                failed_specs.append(spec)
-                continue
+        finally:
+            # Memoized heatmap inputs are shared by the specifications of this run only
+            clear_heatmap_cache()
         
         # Validate we have at least some successful specifications
         if len(heatmap_images_by_spec) == 0:
@@ -371,11 +377,7 @@ def run_inventory_reporting_pipeline(
             logger.warning(f"Continuing with {len(heatmap_images_by_spec)} successful specifications")
         
         # Data sanity check: Check if incoming MT is 0 for all specs
-        all_incoming_zero = True
-        for spec, metrics in metrics_by_spec.items():
-            if metrics.get('incoming', 0) != 0:
-                all_incoming_zero = False
-                break
+        all_incoming_zero = all(metrics.get('incoming', 0) == 0 for metrics in metrics_by_spec.values())
         if all_incoming_zero and len(metrics_by_spec) > 0:
             logger.warning("Data check: Incoming MT is 0 for all specifications. This may indicate missing incoming stock data.")
         
@@ -391,7 +393,8 @@ def run_inventory_reporting_pipeline(
             report_date = datetime.now()
             logger.warning("report_date not provided and not available from S3, using current date")
         
-        logger.info(f"Final report date used: {format_date(report_date)}")
+        report_date_display = format_date(report_date)
+        logger.info(f"Final report date used: {report_date_display}")
         
         try:
             success, pdf_path, pdf_error = generate_inventory_pdf(
@@ -407,12 +410,14 @@ def run_inventory_reporting_pipeline(
                 return False, error_msg
             
             # PDF validation: Verify PDF file exists and is not empty
-            if not os.path.exists(pdf_path):
+            # One stat call covers both the existence and the size check
+            pdf_stat = _stat_or_none(pdf_path)
+            if pdf_stat is None:
                 error_msg = f"PDF file was not created at expected path: {pdf_path}"
                 logger.error(error_msg)
                 return False, error_msg
             
-            pdf_size = os.path.getsize(pdf_path)
+            pdf_size = pdf_stat.st_size
             if pdf_size == 0:
                 error_msg = f"Generated PDF file is empty (0 bytes): {pdf_path}"
                 logger.error(error_msg)
@@ -444,26 +449,27 @@ def run_inventory_reporting_pipeline(
             logger.info(f"Subject: {email_subject}")
             logger.info(f"Attachment: {pdf_path}")
             
-            # Generate email body for dry-run preview (optional logging)
-            try:
-                if priority_df is None or priority_df.empty:
-                    priority_df = pd.DataFrame(columns=['Specification', 'Total_Free_For_Sale_MT'])
-                
-                html_body_preview = generate_inventory_email_body(
-                    priority_items_df=priority_df,
-                    report_date=report_date,
-                    erp_url=ERP_SYSTEM_LINK,
-                    recipient_name=None
-                )
-                logger.debug(f"Email body preview generated ({len(html_body_preview)} characters)")
-            except Exception as e:
-                logger.debug(f"Could not generate email body preview: {str(e)}")
+            # Generate email body for dry-run preview (only logged at DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    if priority_df is None or priority_df.empty:
+                        priority_df = pd.DataFrame(columns=['Specification', 'Total_Free_For_Sale_MT'])
+                    
+                    html_body_preview = generate_inventory_email_body(
+                        priority_items_df=priority_df,
+                        report_date=report_date,
+                        erp_url=ERP_SYSTEM_LINK,
+                        recipient_name=None
+                    )
+                    logger.debug(f"Email body preview generated ({len(html_body_preview)} characters)")
+                except Exception as e:
+                    logger.debug("Could not generate email body preview: %s", e)
         else:
             logger.info(f"Sending email to {len(EMAIL_RECIPIENTS)} recipients")
             
             # Generate email subject using new format
             email_subject = generate_email_subject(report_date)
-            logger.debug(f"Email subject: {email_subject}")
+            logger.debug("Email subject: %s", email_subject)
             
             # Generate HTML email body using email body generator
             try:
@@ -488,7 +494,7 @@ def run_inventory_reporting_pipeline(
                 <body>
                     <h1>Inventory Report</h1>
                     <p>Please find the weekly inventory report attached.</p>
-                    <p>Report Date: {format_date(report_date)}</p>
+                    <p>Report Date: {report_date_display}</p>
                     <p><em>Note: Email body generation failed. Please refer to the attached PDF for details.</em></p>
                 </body>
                 </html>
@@ -12,6 +12,8 @@ IMPORTANT:
 """
 
 import os
+import stat
+import struct
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
@@ -19,7 +21,6 @@ try:
     from reportlab.lib.pagesizes import A4, landscape
     from reportlab.lib.units import mm
     from reportlab.pdfgen import canvas
-    from reportlab.lib.utils import ImageReader
     from PIL import Image
 except ImportError:
     # ReportLab or Pillow not installed
@@ -27,7 +28,6 @@ except ImportError:
     landscape = None
     mm = None
     canvas = None
-    ImageReader = None
     Image = None
 
 # Import config values
@@ -114,6 +114,10 @@ def format_date(date_value) -> str:
         return str(date_value)
 
 
+# First 8 bytes of every PNG file
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
 def validate_image_file(image_path: str) -> Tuple[bool, Optional[str]]:
     """
     Validate that image file exists and is readable.
@@ -127,25 +131,40 @@ def validate_image_file(image_path: str) -> Tuple[bool, Optional[str]]:
     if not image_path:
         return False, "Image path is empty"
     
-    if not os.path.exists(image_path):
+    # One stat for existence, type and size
+    try:
+        image_stat = os.stat(image_path)
+    except FileNotFoundError:
         return False, f"Image file does not exist: {image_path}"
+    except OSError as e:
+        return False, f"Cannot read image file: {str(e)}"
     
-    if not os.path.isfile(image_path):
+    if not stat.S_ISREG(image_stat.st_mode):
         return False, f"Image path is not a file: {image_path}"
     
     # Check file size
+    if image_stat.st_size == 0:
+        return False, f"Image file is empty: {image_path}"
+    
+    # Heatmaps are PNGs: the signature and IHDR chunk (first 24 bytes) are enough
+    # to know the file is a PNG with real dimensions, without decoding it
     try:
-        file_size = os.path.getsize(image_path)
-        if file_size == 0:
-            return False, f"Image file is empty: {image_path}"
+        with open(image_path, 'rb') as f:
+            header = f.read(24)
     except OSError as e:
         return False, f"Cannot read image file: {str(e)}"
     
-    # Try to open with PIL to verify it's a valid image
+    if len(header) == 24 and header[:8] == PNG_SIGNATURE and header[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', header[16:24])
+        if width == 0 or height == 0:
+            return False, f"Invalid image file: PNG has zero dimensions ({width}x{height})"
+        return True, None
+    
+    # Not a PNG - try to open with PIL to verify it's a valid image
     if Image:
         try:
-            img = Image.open(image_path)
-            img.verify()
+            with Image.open(image_path) as img:
+                img.verify()
         except Exception as e:
             return False, f"Invalid image file: {str(e)}"
     
@@ -340,9 +359,10 @@ def generate_inventory_pdf(
                 y_pos -= 20
                 
                 try:
-                    # Open image to get dimensions
-                    img = Image.open(image_path)
-                    img_width, img_height = img.size
+                    # Read dimensions from the image header only; the pixels are
+                    # decoded once, by reportlab, when the image is drawn
+                    with Image.open(image_path) as img:
+                        img_width, img_height = img.size
                     
                     # Calculate scaling to fit in available space
                     # Leave space for summary metrics below (reduced from 150 to 120 for larger image)
@@ -367,7 +387,7 @@ def generate_inventory_pdf(
                     
                     # Draw image
                     c.drawImage(
-                        ImageReader(image_path),
+                        image_path,
                         image_x,
                         image_y,
                         width=final_width,
@@ -11,7 +11,10 @@ CRITICAL SAFETY:
 """
 
 import os
+import threading
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from typing import Tuple, Optional
 from datetime import datetime
 from pathlib import Path
@@ -21,11 +24,35 @@ from reporting.config import REPORTS_DIR
 
 logger = get_logger(__name__)
 
+# Connection settings for the S3 client: keep-alive and a small connection
+# pool so that a reused client does not repeat the TLS handshake
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=10,
+    tcp_keepalive=True,
+    retries={'mode': 'standard'}
+)
+
+# Multipart download settings for the inventory file
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# The S3 client is built once per process and reused while the credentials
+# and region (_S3_CLIENT_KEY) stay the same
+_S3_CLIENT = None
+_S3_CLIENT_KEY = None
+_S3_CLIENT_LOCK = threading.Lock()
+
 
 def _get_s3_client():
     """
     Initialize boto3 S3 client with read-only credentials.
     
+    The client is cached at module level and reused by later calls in the
+    same process, as long as the credentials and region are unchanged.
+    
     Returns:
         boto3 S3 client or None if configuration is missing
     
@@ -34,6 +61,7 @@ def _get_s3_client():
         AWS_SECRET_ACCESS_KEY: AWS secret key
         AWS_REGION: AWS region (default: us-east-1)
     """
+    global _S3_CLIENT, _S3_CLIENT_KEY
     try:
         aws_access_key = os.getenv('AWS_ACCESS_KEY_ID')
         aws_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
@@ -43,12 +71,21 @@ def _get_s3_client():
             logger.error("AWS credentials not configured. Missing AWS_ACCESS_KEY_ID or AWS_SECRET_ACCESS_KEY")
             return None
         
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=aws_region
-        )
+        client_key = (aws_access_key, aws_secret_key, aws_region)
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is not None and _S3_CLIENT_KEY == client_key:
+                logger.debug(f"Reusing S3 client for region: {aws_region}")
+                return _S3_CLIENT
+            
+            s3_client = boto3.client(
+                's3',
+                aws_access_key_id=aws_access_key,
+                aws_secret_access_key=aws_secret_key,
+                region_name=aws_region,
+                config=S3_CLIENT_CONFIG
+            )
+            _S3_CLIENT = s3_client
+            _S3_CLIENT_KEY = client_key
         
         logger.debug(f"S3 client initialized for region: {aws_region}")
         return s3_client
@@ -226,7 +263,8 @@ def fetch_latest_inventory_file(
             s3_client.download_file(
                 Bucket=bucket_name,
                 Key=latest_key,
-                Filename=str(local_file_path)
+                Filename=str(local_file_path),
+                Config=S3_TRANSFER_CONFIG
             )
             
             # Verify downloaded file
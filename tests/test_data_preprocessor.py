@@ -0,0 +1,34 @@
+"""
+Tests for the column contract of reporting.data_preprocessor.
+
+Callers such as comparison_tab.calculate_free_for_sale() group on
+Specification.astype(str), so missing specifications must stay None in an
+object column, as the dashboard produces them, and not become pd.NA.
+"""
+
+import unittest
+
+import numpy as np
+import pandas.io.formats.style  # noqa: F401 - imported before reporting, as the pipeline does
+import pandas as pd
+
+from reporting.data_preprocessor import normalize_sheet_columns
+
+
+class NormalizeSpecificationTest(unittest.TestCase):
+
+    def test_specification_is_object_with_none_for_missing(self):
+        df = pd.DataFrame({
+            'Specification': [' CSSMP106B ', 'nan', np.nan, '', 'ASSMPP11'],
+            'MT': [1.0, 2.0, 3.0, 4.0, 5.0],
+        })
+
+        specs = normalize_sheet_columns(df)['Specification']
+
+        self.assertEqual(specs.dtype, object)
+        self.assertEqual(specs.tolist(), ['CSSMP106B', None, None, None, 'ASSMPP11'])
+        self.assertEqual(specs.astype(str).tolist(), ['CSSMP106B', 'None', 'None', 'None', 'ASSMPP11'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Regression tests for heatmap values in reporting.heatmap_generator.
+
+The report must show the same numbers as the dashboard, which rounds each
+pivot cell with Python's round() and sums the totals with DataFrame.sum.
+The values below sit on .xx5 rounding ties, where a different rounding
+function or summation order changes the second decimal.
+"""
+
+import unittest
+
+import pandas.io.formats.style  # noqa: F401 - imported before reporting, as the pipeline does
+import pandas as pd
+
+from reporting import heatmap_generator
+from reporting.heatmap_generator import generate_heatmap_dataframe
+
+
+INVENTORY_COLUMNS = ['Specification', 'OD', 'WT', 'MT', 'Make']
+
+
+class HeatmapRoundingTest(unittest.TestCase):
+
+    def setUp(self):
+        heatmap_generator.clear_heatmap_cache()
+
+    def tearDown(self):
+        heatmap_generator.clear_heatmap_cache()
+
+    def test_cells_round_half_up_like_the_dashboard(self):
+        # 35.905 is stored just above the tie: round() gives 35.91, while
+        # DataFrame.round (scale by 100, round half to even) gives 35.9
+        stock = pd.DataFrame(
+            [['CSSMP106B', 60.3, 9.99, 35.905, 'A'],
+             ['CSSMP106B', 60.3, 3.91, 1.0, 'A']],
+            columns=INVENTORY_COLUMNS
+        )
+        empty = pd.DataFrame(columns=INVENTORY_COLUMNS)
+
+        styled, metrics, error = generate_heatmap_dataframe(stock, empty.copy(), empty.copy(), 'CSSMP106B')
+
+        self.assertIsNone(error)
+        self.assertEqual(styled.data.loc['* 2"', 'Non STD'], 35.91)
+        self.assertEqual(styled.data.loc['Total', 'Non STD'], 35.91)
+        self.assertEqual(styled.data.loc['Total', 'Total'], 36.91)
+
+    def test_totals_sum_in_dashboard_order(self):
+        # Column "STD" sums to 3.8550000000000004 in the dashboard's order
+        # (rounds to 3.86) but to 3.854999999999997 in a pairwise order (3.85)
+        od_categories = ['1/2"', '1-1/2"', '2"', '4"', '6"', '8"', '10"', 'Non Standard OD']
+        pivot = pd.DataFrame(
+            [[0.0, 0.0, 48.374, 0.592, 0.0, 235.837],
+             [0.0, 0.0, 0.0, -3.494, 80.248, 89.938],
+             [8.689, 38.727, 0.0, 0.0, 0.0, -27.91],
+             [0.0, 0.0, 0.0, 0.0, 0.0, 292.131],
+             [0.0, 0.0, -36.054, 0.0, 0.0, 178.228],
+             [23.895, 0.0, 0.0, 0.0, 0.0, 141.053],
+             [0.0, 0.0, 0.911, 0.0, 0.0, -29.599],
+             [4.066, 0.0, -9.376, 0.0, 0.0, 351.826]],
+            index=pd.Index(od_categories, name="OD_Category"),
+            columns=pd.Index(['SCH 10', 'SCH 30', 'STD', 'XS', 'SCH 160', 'Non STD'], name="WT_Schedule")
+        )
+
+        totals = heatmap_generator._add_totals(pivot)
+
+        self.assertEqual(round(totals.loc['Total', 'STD'], 2), 3.86)
+
+
+if __name__ == '__main__':
+    unittest.main()